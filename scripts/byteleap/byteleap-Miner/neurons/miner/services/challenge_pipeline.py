@@ -8,8 +8,10 @@ from typing import Any, Dict, List
 
 import bittensor as bt
 
-from neurons.shared.protocols import (Commitment, CommitmentData, ProofData,
-                                      ProofRequest, ProofResponse,
+from neurons.shared.protocols import (COMMITMENT_LIST_ADAPTER,
+                                      PROOF_REQUEST_LIST_ADAPTER,
+                                      PROOF_RESPONSE_LIST_ADAPTER,
+                                      CommitmentData, ProofData,
                                       ProtocolRegistry, ProtocolTypes)
 
 
@@ -60,7 +62,9 @@ class ChallengePipeline:
             commitment_data = CommitmentData(
                 challenge_id=task_id,
                 worker_id=worker_id,
-                commitments=[Commitment(**c) for c in result.get("commitments", [])],
+                commitments=COMMITMENT_LIST_ADAPTER.validate_python(
+                    result.get("commitments", [])
+                ),
             )
 
             # Phase 1 must respond quickly; if validator doesn't respond
@@ -94,7 +98,9 @@ class ChallengePipeline:
                 bt.logging.debug(f"No proofs requested | challenge_id={task_id}")
                 return
 
-            proof_requests = [ProofRequest(**pr) for pr in proof_requests_data]
+            proof_requests = PROOF_REQUEST_LIST_ADAPTER.validate_python(
+                proof_requests_data
+            )
             bt.logging.info(
                 f"🧪 Phase1 complete | challenge_id={task_id} proof_requests={len(proof_requests)}"
             )
@@ -119,9 +125,9 @@ class ChallengePipeline:
 
             proof_data = ProofData(
                 challenge_id=task_id,
-                proofs=[
-                    ProofResponse(**p) for p in (proof_response.get("proofs", []) or [])
-                ],
+                proofs=PROOF_RESPONSE_LIST_ADAPTER.validate_python(
+                    proof_response.get("proofs", []) or []
+                ),
                 debug_info={"timestamps": all_timestamps},
             )
 
@@ -713,7 +713,7 @@ class MinerCommunicationService(BaseCommunicationService):
             )
 
             if result.success and result.data:
-                task_response = TaskResponse(**result.data)
+                task_response = TaskResponse.model_validate(result.data)
                 if task_response.task_type != "no_task":
                     bt.logging.info(
                         f"📋 Task received | type={task_response.task_type} validator_uid={uid}"
@@ -8,7 +8,7 @@ from typing import Any, Dict, List, Optional
 
 import bittensor as bt
 
-from neurons.shared.protocols import HeartbeatData, SystemInfo
+from neurons.shared.protocols import HeartbeatData, SystemInfo, frozen_clock
 
 
 class HeartbeatService:
@@ -109,6 +109,8 @@ class HeartbeatService:
             items = [heartbeats[i] for i in dedup_index.values()]
 
             workers: List[Any] = []
+            # One clock read for the whole batch
+            now = time.time()
 
             # Miner host info
             miner_info = None
@@ -145,7 +147,7 @@ class HeartbeatService:
                             "capabilities": w.get("capabilities", []),
                             "status": w.get("status", "offline"),
                             "system_info": sysinfo.model_dump(),
-                            "connected_at": w.get("connected_at", time.time()),
+                            "connected_at": w.get("connected_at", now),
                             "last_heartbeat": hb.get("timestamp"),
                         }
                     )
@@ -154,12 +156,13 @@ class HeartbeatService:
                         f"⚠️ Skip malformed worker heartbeat | worker_id={w.get('worker_id')}"
                     )
 
-            heartbeat = HeartbeatData(
-                hotkey=self.wallet.hotkey.ss58_address,
-                timestamp=time.time(),
-                workers=workers,  # pydantic will coerce list of dicts to models
-                miner_info=miner_info,
-            )
+            with frozen_clock(now):
+                heartbeat = HeartbeatData(
+                    hotkey=self.wallet.hotkey.ss58_address,
+                    timestamp=now,
+                    workers=workers,  # pydantic will coerce list of dicts to models
+                    miner_info=miner_info,
+                )
 
             # Send out
             validators = self.validator_cache.get_validators()
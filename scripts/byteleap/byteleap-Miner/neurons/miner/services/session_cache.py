@@ -13,6 +13,7 @@ import bittensor as bt
 
 from neurons.shared.crypto import CryptoManager
 from neurons.shared.session_replay_protection import SlidingWindowValidator
+from neurons.shared.utils import json_codec
 
 
 class SessionState:
@@ -195,8 +196,6 @@ class SessionCache:
             client_nonce_b64 = base64.b64encode(client_nonce).decode("ascii")
 
             # Create session init request
-            import json
-
             from neurons.shared.protocols import (SessionInitRequest,
                                                   SessionInitSynapse)
 
@@ -205,7 +204,7 @@ class SessionCache:
             )
 
             # Create synapse
-            synapse = SessionInitSynapse(request=json.dumps(request.model_dump()))
+            synapse = SessionInitSynapse(request=json_codec.dumps(request.model_dump()))
 
             # Send handshake request via dendrite using async context manager
             async with bt.dendrite(wallet=self.crypto_manager.wallet) as dendrite:
@@ -247,7 +246,7 @@ class SessionCache:
                 if not raw_response:
                     return None, "Empty handshake response"
                 try:
-                    response_data = json.loads(raw_response)
+                    response_data = json_codec.loads(raw_response)
                 except Exception:
                     # Treat non-JSON string as plaintext error per protocol rules
                     return None, f"Handshake failed: {raw_response}"
@@ -264,31 +263,17 @@ class SessionCache:
 
             from neurons.shared.protocols import SessionInitResponse
 
+            # Model validation enforces the 32-byte key and 16-byte nonce lengths
             session_response = SessionInitResponse(**response_data)
 
-            # Validate parameter lengths
-            validator_pub_bytes = base64.b64decode(
-                session_response.validator_eph_pub32.encode("ascii")
-            )
-            if len(validator_pub_bytes) != 32:
-                return (
-                    None,
-                    f"Invalid validator public key length: {len(validator_pub_bytes)} != 32",
-                )
-
-            server_nonce = base64.b64decode(
-                session_response.server_nonce16.encode("ascii")
-            )
-            if len(server_nonce) != 16:
-                return None, f"Invalid server nonce length: {len(server_nonce)} != 16"
-
             k_cs, k_sc = self.crypto_manager.complete_handshake(
                 miner_private_bytes,
                 miner_pub_b64,
                 session_response.validator_eph_pub32,
                 client_nonce,
-                server_nonce,
+                session_response.raw_nonce,
                 validator_hotkey,
+                peer_eph_pub_bytes=session_response.raw_pub,
             )
 
             # Create session state
@@ -12,6 +12,16 @@ import bittensor as bt
 
 from neurons.shared.protocols import CommunicationResult, ErrorCodes
 
+# Validator error codes that invalidate the cached session and allow one retry
+_SESSION_ERROR_CODES = frozenset(
+    (
+        ErrorCodes.SEQUENCE_ERROR,
+        ErrorCodes.SESSION_EXPIRED,
+        ErrorCodes.SESSION_UNKNOWN,
+        ErrorCodes.REHANDSHAKE_REQUIRED,
+    )
+)
+
 
 class SessionTransport:
     """Encapsulates session-based encrypted communication to validators."""
@@ -192,13 +202,7 @@ class SessionTransport:
                         error_code = error_response["error_code"]
                         error_msg = error_response["error"]
 
-                        session_errors = [
-                            ErrorCodes.SEQUENCE_ERROR,
-                            ErrorCodes.SESSION_EXPIRED,
-                            ErrorCodes.SESSION_UNKNOWN,
-                            ErrorCodes.REHANDSHAKE_REQUIRED,
-                        ]
-                        if error_code in session_errors and _retry_count == 0:
+                        if error_code in _SESSION_ERROR_CODES and _retry_count == 0:
                             bt.logging.warning(
                                 f"🔄 Session error from {target_hotkey}, invalidating and retrying"
                             )
@@ -21,6 +21,7 @@ from neurons.miner.services.message_models import (ProofResponseMessage,
                                                    WorkerHeartbeatMessage,
                                                    WorkerRegistration)
 from neurons.shared.config.config_manager import ConfigManager
+from neurons.shared.utils import json_codec
 from neurons.shared.utils.error_handler import ErrorHandler, WorkerError
 
 # Memory management constants
@@ -31,6 +32,12 @@ WS_PING_INTERVAL = 20
 WS_PING_TIMEOUT = 30
 WS_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
 
+# Fixed acknowledgement frames, serialized once
+REGISTRATION_ACK_FRAME = json_codec.dumps_bytes(
+    {"type": "registration_ack", "data": {"status": "registered"}}
+)
+HEARTBEAT_ACK_FRAME = json_codec.dumps_bytes({"type": "heartbeat_ack"})
+
 
 @dataclass
 class WorkerConnection:
@@ -187,11 +194,7 @@ class WorkerManager:
                         self.workers[worker_id]
                     )
                 self.workers[worker_id] = worker_connection
-            await websocket.send(
-                json.dumps(
-                    {"type": "registration_ack", "data": {"status": "registered"}}
-                )
-            )
+            await websocket.send(REGISTRATION_ACK_FRAME)
             bt.logging.info(
                 f"✅ Worker registered | id={worker_id} name={worker_connection.worker_name}"
             )
@@ -209,7 +212,7 @@ class WorkerManager:
         try:
             async for message in worker.websocket:
                 try:
-                    data = json.loads(message)
+                    data = json_codec.loads(message)
                     message_type = data.get("type")
                     bt.logging.debug(
                         f"📥 Worker message | type={message_type} id={worker.worker_id}"
@@ -304,7 +307,7 @@ class WorkerManager:
                 "connected_at": worker.connected_at,
             }
             await self.communication_service.queue_worker_heartbeat(worker_info)
-        await worker.websocket.send(json.dumps({"type": "heartbeat_ack"}))
+        await worker.websocket.send(HEARTBEAT_ACK_FRAME)
 
     async def _handle_task_result(self, worker: WorkerConnection, data: Any):
         # data may be a TaskResultMessage or raw dict
@@ -377,7 +380,9 @@ class WorkerManager:
                 return False
             try:
                 await worker.websocket.send(
-                    json.dumps({"type": "task_assignment", "data": task_data})
+                    json_codec.dumps_bytes(
+                        {"type": "task_assignment", "data": task_data}
+                    )
                 )
                 worker.current_tasks.add(task_data["task_id"])
                 worker.status = "busy"
@@ -484,7 +489,7 @@ class WorkerManager:
         self._pending_proof_requests[message_id] = future
 
         try:
-            await worker.websocket.send(json.dumps(proof_request_message))
+            await worker.websocket.send(json_codec.dumps_bytes(proof_request_message))
             bt.logging.info(
                 f"📨 Proof request sent | id={message_id} worker_id={worker_id}"
             )
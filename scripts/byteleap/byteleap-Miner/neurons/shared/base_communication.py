@@ -3,9 +3,10 @@ Base Communication Service
 Common functionality shared between miner and validator communication services
 """
 
+import logging
 import time
-from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from functools import cached_property, wraps
+from typing import Any, Callable, NamedTuple, Optional
 
 import bittensor as bt
 
@@ -14,6 +15,13 @@ from neurons.shared.protocols import CommunicationResult, ErrorCodes
 from neurons.shared.synapse import SynapseHandler
 
 
+class PeerInfo(NamedTuple):
+    """Peer identity extracted for logging"""
+
+    hotkey: str
+    address: str
+
+
 class BaseCommunicationService:
     """Base class for communication services with common functionality"""
 
@@ -22,13 +30,25 @@ class BaseCommunicationService:
         # Core components
         self.wallet = wallet
         self.config = config
-        self.synapse_handler = SynapseHandler()
-        self.logger = CommunicationLogger(component_name)
+        self._component_name = component_name
+        # Bound log methods reused by the operation wrapper on every call
+        self._log_err = bt.logging.error
+        self._log_dbg = bt.logging.debug
 
         bt.logging.info(
             f"🚀 {component_name} comm initialized | wallet={self.wallet.name}"
         )
 
+    @cached_property
+    def synapse_handler(self) -> SynapseHandler:
+        """Synapse helper, created on first use"""
+        return SynapseHandler()
+
+    @cached_property
+    def logger(self) -> CommunicationLogger:
+        """Communication logger, created on first use"""
+        return CommunicationLogger(self._component_name)
+
     def communication_operation(self, operation_name: str):
         """
         Decorator for communication operations with unified error handling and logging
@@ -62,18 +82,20 @@ class BaseCommunicationService:
                 except Exception as e:
                     result.error_code = ErrorCodes.INVALID_RESPONSE
                     result.error_message = f"{operation_name} failed: {str(e)}"
-                    bt.logging.error(f"❌ {operation_name} error | error={e}")
+                    self._log_err(f"❌ {operation_name} error | error={e}")
 
                 finally:
                     result.processing_time_ms = (time.time() - start_time) * 1000
 
-                    # Log completion
+                    # Log completion; bt.logging has no lazy %-args, so skip
+                    # building the success message when DEBUG is filtered out
                     if result.success:
-                        bt.logging.debug(
-                            f"✅ {operation_name} done | time={result.processing_time_ms:.1f}ms"
-                        )
+                        if bt.logging.get_level() <= logging.DEBUG:
+                            self._log_dbg(
+                                f"✅ {operation_name} done | time={result.processing_time_ms:.1f}ms"
+                            )
                     else:
-                        bt.logging.error(
+                        self._log_err(
                             f"❌ {operation_name} fail | err={result.error_message}"
                         )
 
@@ -83,17 +105,19 @@ class BaseCommunicationService:
 
         return decorator
 
-    def get_peer_info(self, synapse_or_hotkey) -> Dict[str, str]:
+    def get_peer_info(self, synapse_or_hotkey) -> PeerInfo:
         """Extract peer information for logging"""
-        if hasattr(synapse_or_hotkey, "dendrite"):
-            # It's a synapse
-            hotkey = (
-                synapse_or_hotkey.dendrite.hotkey
-                if synapse_or_hotkey.dendrite
-                else "unknown"
-            )
-            address = self.synapse_handler.get_peer_address(synapse_or_hotkey)
-            return {"hotkey": hotkey, "address": address}
-        else:
+        if isinstance(synapse_or_hotkey, str):
             # It's a hotkey string
-            return {"hotkey": str(synapse_or_hotkey), "address": "unknown"}
+            return PeerInfo(synapse_or_hotkey, "unknown")
+
+        try:
+            dendrite = synapse_or_hotkey.dendrite
+        except AttributeError:
+            # Neither a synapse nor a hotkey string
+            return PeerInfo(str(synapse_or_hotkey), "unknown")
+
+        # It's a synapse
+        hotkey = dendrite.hotkey if dendrite else "unknown"
+        address = self.synapse_handler.get_peer_address(synapse_or_hotkey)
+        return PeerInfo(hotkey, address)
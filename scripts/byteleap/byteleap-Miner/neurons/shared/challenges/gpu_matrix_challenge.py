@@ -3,7 +3,9 @@ GPU Matrix Multiplication Challenge
 GPU-intensive algorithm for performance evaluation using CUDA
 """
 
+import functools
 import hashlib
+import operator
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -11,6 +13,21 @@ from loguru import logger
 
 from neurons.shared.challenges.base_matrix_challenge import BaseMatrixChallenge
 
+# Fields read from each per-GPU result when building commitments
+_commitment_fields = operator.itemgetter(
+    "gpu_uuid", "merkle_root", "sig_ver", "sig_val"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _dynamic_size_bounds(base_size: int, variance: float) -> Tuple[int, int]:
+    """Inclusive (min_size, max_size) range for a base size and variance"""
+    min_size = int(base_size * (1.0 - variance))
+    max_size = int(base_size * (1.0 + variance))
+
+    # Ensure minimum size is at least 1
+    return max(1, min_size), max_size
+
 
 class GPUMatrixChallenge(BaseMatrixChallenge):
     """
@@ -81,20 +98,16 @@ class GPUMatrixChallenge(BaseMatrixChallenge):
         if variance == 0.0:
             return base_size
 
+        min_size, max_size = _dynamic_size_bounds(base_size, variance)
+
+        if min_size >= max_size:
+            return base_size
+
         import numpy as np
 
         seed_int = int.from_bytes(seed[:4], "big")
         rng = np.random.RandomState(seed_int)
 
-        min_size = int(base_size * (1.0 - variance))
-        max_size = int(base_size * (1.0 + variance))
-
-        # Ensure minimum size is at least 1
-        min_size = max(1, min_size)
-
-        if min_size >= max_size:
-            return base_size
-
         return rng.randint(min_size, max_size + 1)
 
     @staticmethod
@@ -134,7 +147,15 @@ class GPUMatrixChallenge(BaseMatrixChallenge):
             row_hashes_to_cache = {}
 
             for res in gpu_results:
-                gpu_uuid = res.get("gpu_uuid")
+                try:
+                    gpu_uuid, merkle_root, sig_ver, sig_val = _commitment_fields(res)
+                except KeyError:
+                    # Incomplete result; fall back to per-field defaults
+                    gpu_uuid = res.get("gpu_uuid")
+                    merkle_root = res.get("merkle_root", "")
+                    sig_ver = res.get("sig_ver", 1)
+                    sig_val = res.get("sig_val", "")
+
                 if not gpu_uuid:
                     logger.warning("Skipping GPU result due to missing UUID")
                     continue
@@ -142,9 +163,9 @@ class GPUMatrixChallenge(BaseMatrixChallenge):
                 # Create the commitment object for this GPU
                 commitment = {
                     "uuid": gpu_uuid,
-                    "merkle_root": res.get("merkle_root", ""),
-                    "sig_ver": res.get("sig_ver", 1),
-                    "sig_val": res.get("sig_val", ""),
+                    "merkle_root": merkle_root,
+                    "sig_ver": sig_ver,
+                    "sig_val": sig_val,
                 }
                 commitments.append(commitment)
 
@@ -164,12 +185,22 @@ class GPUMatrixChallenge(BaseMatrixChallenge):
 
             return unified_result, row_hashes_to_cache
 
+        except (RuntimeError, ValueError) as e:
+            # Expected failures reported by the GPU server; no traceback needed
+            logger.warning(f"GPU challenge invalid: {e}")
+            return GPUMatrixChallenge._error_result(challenge_data, e), {}
         except Exception as e:
             logger.error(f"GPU challenge execution failed: {e}", exc_info=True)
-            error_result = {
-                "computation_time_ms": float("inf"),
-                "matrix_size": challenge_data.get("matrix_size", 0),
-                "commitments": [],
-                "error": str(e),
-            }
-            return error_result, {}
+            return GPUMatrixChallenge._error_result(challenge_data, e), {}
+
+    @staticmethod
+    def _error_result(
+        challenge_data: Dict[str, Any], error: Exception
+    ) -> Dict[str, Any]:
+        """Build the unified result reported for a failed GPU execution"""
+        return {
+            "computation_time_ms": float("inf"),
+            "matrix_size": challenge_data.get("matrix_size", 0),
+            "commitments": [],
+            "error": str(error),
+        }
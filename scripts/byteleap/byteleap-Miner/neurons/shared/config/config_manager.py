@@ -3,19 +3,76 @@ Simplified Configuration Management
 Basic configuration loading and management
 """
 
+import functools
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import bittensor as bt
 import yaml
 
+_MISSING = object()
+_MAPPING_TYPES = (dict, MappingProxyType)
+
+
+@functools.lru_cache(maxsize=512)
+def _split_dotted_path(path: str) -> Tuple[str, ...]:
+    """Split a '.'-separated config path, cached since paths are a small fixed set"""
+    return tuple(path.split("."))
+
 
 class ConfigManager:
     """Fail-fast configuration manager with strict access control"""
 
-    def __init__(self, config: Dict[str, Any] = None):
-        """Initialize configuration manager"""
+    def __init__(
+        self,
+        config: Dict[str, Any] = None,
+        schema: Optional[Dict[str, type]] = None,
+    ):
+        """
+        Initialize configuration manager
+
+        Args:
+            config: Configuration dictionary
+            schema: Optional mapping of required dot-separated paths to expected
+                types, validated once up front
+
+        Raises:
+            KeyError: If any schema key is missing
+            ValueError: If any schema value has the wrong type
+        """
         self.config = config or {}
+        # Read-only snapshot used for lookups; rebuilt by update(), the only
+        # supported mutation, so readers never observe a partial update
+        self._frozen = MappingProxyType(dict(self.config))
+        # Resolved values keyed by full path; filled by schema and on first get()
+        self._flat: Dict[str, Any] = {}
+        if schema:
+            self._validate_schema(schema)
+
+    def _validate_schema(self, schema: Dict[str, type]) -> None:
+        """Resolve and type-check all schema paths, reporting all failures together"""
+        missing = []
+        invalid = []
+        for path, expected_type in schema.items():
+            value = self._get_nested_optional(path, _MISSING)
+            if value is _MISSING:
+                missing.append(path)
+            elif not isinstance(value, expected_type):
+                invalid.append(
+                    f"'{path}' must be {expected_type.__name__}, got {type(value).__name__}"
+                )
+            else:
+                self._flat[path] = value
+
+        if missing:
+            bt.logging.error(f"❌ Missing config keys | keys={', '.join(missing)}")
+            raise KeyError(
+                f"Missing required configuration keys: {', '.join(repr(p) for p in missing)}"
+            )
+        if invalid:
+            bt.logging.error(f"❌ Invalid config types | {'; '.join(invalid)}")
+            raise ValueError(f"Invalid configuration types: {'; '.join(invalid)}")
 
     def get(self, path: str) -> Any:
         """
@@ -30,13 +87,37 @@ class ConfigManager:
         Raises:
             KeyError: If configuration key is missing
         """
+        try:
+            return self._flat[path]
+        except KeyError:
+            pass
+
         if "." in path:
-            return self.get_nested(path)
+            value = self.get_nested(path)
         else:
-            if path not in self.config:
+            if path not in self._frozen:
                 bt.logging.error(f"❌ Missing config key | key={path}")
                 raise KeyError(f"Missing required configuration key: '{path}'")
-            return self.config[path]
+            value = self._frozen[path]
+
+        self._flat[path] = value
+        return value
+
+    def resolve_many(self, paths: Tuple[str, ...]) -> Tuple[Any, ...]:
+        """
+        Get several required configuration values in one call
+
+        Args:
+            paths: Keys or dot-separated paths, in the order values are wanted
+
+        Returns:
+            Tuple of configuration values matching paths
+
+        Raises:
+            KeyError: If any configuration key is missing
+        """
+        flat = self._flat
+        return tuple(flat[path] if path in flat else self.get(path) for path in paths)
 
     def get_nested(self, path: str, separator: str = ".") -> Any:
         """
@@ -52,22 +133,38 @@ class ConfigManager:
         Raises:
             KeyError: If any key in the path is missing
         """
-        keys = path.split(separator)
-        value = self.config
+        # Fast path for 1-2 segment paths, which avoids building a key list
+        head, sep, rest = path.partition(separator)
+        if separator not in rest:
+            if head not in self._frozen:
+                self._raise_missing_key(head, path)
+            if not sep:
+                return self._frozen[head]
+            section = self._frozen[head]
+            if not isinstance(section, dict) or rest not in section:
+                self._raise_missing_key(path, path)
+            return section[rest]
+
+        keys = _split_dotted_path(path) if separator == "." else path.split(separator)
+        value = self._frozen
 
         for i, key in enumerate(keys):
-            if not isinstance(value, dict) or key not in value:
-                current_path = separator.join(keys[: i + 1])
-                bt.logging.error(
-                    f"Missing required configuration key: '{current_path}' in path '{path}'"
-                )
-                raise KeyError(
-                    f"Missing required configuration key: '{current_path}' in path '{path}'"
-                )
+            if not isinstance(value, _MAPPING_TYPES) or key not in value:
+                self._raise_missing_key(separator.join(keys[: i + 1]), path)
             value = value[key]
 
         return value
 
+    @staticmethod
+    def _raise_missing_key(current_path: str, path: str) -> None:
+        """Log and raise KeyError for a missing key within path"""
+        bt.logging.error(
+            f"Missing required configuration key: '{current_path}' in path '{path}'"
+        )
+        raise KeyError(
+            f"Missing required configuration key: '{current_path}' in path '{path}'"
+        )
+
     def get_optional(self, path: str, default: Any = None) -> Any:
         """
         Get optional configuration value (allows None/missing values)
@@ -83,7 +180,7 @@ class ConfigManager:
             if "." in path:
                 return self._get_nested_optional(path, default)
             else:
-                return self.config.get(path, default)
+                return self._frozen.get(path, default)
         except KeyError:
             return default
 
@@ -91,11 +188,22 @@ class ConfigManager:
         self, path: str, default: Any = None, separator: str = "."
     ) -> Any:
         """Get nested optional configuration value"""
-        keys = path.split(separator)
-        value = self.config
+        head, sep, rest = path.partition(separator)
+        if separator not in rest:
+            if head not in self._frozen:
+                return default
+            value = self._frozen[head]
+            if not sep:
+                return value
+            if isinstance(value, dict) and rest in value:
+                return value[rest]
+            return default
+
+        keys = _split_dotted_path(path) if separator == "." else path.split(separator)
+        value = self._frozen
 
         for key in keys:
-            if isinstance(value, dict) and key in value:
+            if isinstance(value, _MAPPING_TYPES) and key in value:
                 value = value[key]
             else:
                 return default
@@ -105,6 +213,8 @@ class ConfigManager:
     def update(self, updates: Dict[str, Any]) -> None:
         """Update configuration"""
         self.config.update(updates)
+        self._frozen = MappingProxyType(dict(self.config))
+        self._flat = {}
 
     def get_positive_number(
         self, path: str, number_type: type = int
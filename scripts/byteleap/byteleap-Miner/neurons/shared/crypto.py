@@ -126,6 +126,7 @@ class CryptoManager:
         client_nonce: bytes,
         server_nonce: bytes,
         peer_hotkey: str = "",
+        peer_eph_pub_bytes: Optional[bytes] = None,
     ) -> Tuple[bytes, bytes]:
         """
         Complete handshake using our private key and peer's public key
@@ -136,6 +137,7 @@ class CryptoManager:
             peer_eph_pub_b64: Peer's ephemeral public key (base64)
             client_nonce: Client nonce (16 bytes)
             server_nonce: Server nonce (16 bytes)
+            peer_eph_pub_bytes: Peer's public key already decoded, if available
 
         Returns:
             Tuple of (k_cs, k_sc) session keys
@@ -144,7 +146,9 @@ class CryptoManager:
         our_private = x25519.X25519PrivateKey.from_private_bytes(our_private_key_bytes)
 
         # Decode peer's public key
-        peer_pub_bytes = base64.b64decode(peer_eph_pub_b64.encode("ascii"))
+        peer_pub_bytes = peer_eph_pub_bytes or base64.b64decode(
+            peer_eph_pub_b64.encode("ascii")
+        )
         peer_public = x25519.X25519PublicKey.from_public_bytes(peer_pub_bytes)
 
         # Perform ECDH
@@ -372,9 +376,8 @@ class CryptoManager:
             aesgcm = AESGCM(session_key)
             decrypted_bytes = aesgcm.decrypt(iv, ciphertext_with_tag, aad)
 
-            # Deserialize
-            json_data = decrypted_bytes.decode("utf-8")
-            decrypted_data = json.loads(json_data)
+            # Deserialize straight from bytes; json detects UTF-8 itself
+            decrypted_data = json.loads(decrypted_bytes)
 
             return decrypted_data, session_id, seq
 
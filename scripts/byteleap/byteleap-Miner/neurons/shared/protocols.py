@@ -3,14 +3,72 @@ Subnet Communication Protocol Definition
 Define communication protocols and data structures between miner and validator
 """
 
-import base64
 import binascii
+import re
+import sys
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import IntEnum
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Type
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+)
 
 import bittensor as bt
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    model_validator,
+)
+
+try:
+    # SIMD-accelerated drop-in for base64.b64decode
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from base64 import b64decode as _b64decode
+
+
+# Timestamp shared by all models built inside a frozen_clock() block; a
+# ContextVar so other threads and tasks keep reading the real clock
+_frozen_now: ContextVar[Optional[float]] = ContextVar("_frozen_now", default=None)
+
+
+def _now() -> float:
+    """Timestamp default factory honouring frozen_clock()"""
+    frozen = _frozen_now.get()
+    return time.time() if frozen is None else frozen
+
+
+@contextmanager
+def frozen_clock(now: Optional[float] = None) -> Iterator[float]:
+    """
+    Pin timestamp defaults to a single clock read for a batch build
+
+    The pin is local to the current thread / asyncio context.
+
+    Args:
+        now: Timestamp to use; defaults to the current time
+
+    Yields:
+        The pinned timestamp
+    """
+    pinned = time.time() if now is None else now
+    token = _frozen_now.set(pinned)
+    try:
+        yield pinned
+    finally:
+        _frozen_now.reset(token)
 
 
 class StrictModel(BaseModel):
@@ -25,6 +83,19 @@ class StrictModel(BaseModel):
     )
 
 
+class FastStrictModel(StrictModel):
+    """Strict base model for high-volume payloads built in loops.
+
+    Skips whitespace stripping and default re-validation; fields on these
+    models are machine-generated identifiers, hashes, base64 and numbers.
+    """
+
+    model_config = ConfigDict(
+        str_strip_whitespace=False,
+        validate_default=False,
+    )
+
+
 class CommunicationResult(StrictModel):
     """Result of communication operation with metadata"""
 
@@ -39,15 +110,16 @@ class CommunicationResult(StrictModel):
 class ProtocolTypes:
     """Stable protocol type constants (immune to class name changes)"""
 
-    HEARTBEAT = "HEARTBEAT_V1"
-    TASK = "TASK_V1"
-    CHALLENGE = "CHALLENGE_V1"
-    CHALLENGE_PROOF = "CHALLENGE_PROOF_V1"
-    SESSION_INIT = "SESSION_INIT_V1"
+    # Interned so registry lookups with these constants hit the identity fast path
+    HEARTBEAT = sys.intern("HEARTBEAT_V1")
+    TASK = sys.intern("TASK_V1")
+    CHALLENGE = sys.intern("CHALLENGE_V1")
+    CHALLENGE_PROOF = sys.intern("CHALLENGE_PROOF_V1")
+    SESSION_INIT = sys.intern("SESSION_INIT_V1")
 
 
 # Error codes
-class ErrorCodes:
+class ErrorCodes(IntEnum):
     """Standard error codes for the subnet protocol"""
 
     # Success
@@ -91,6 +163,39 @@ class ErrorCodes:
     DB_CONNECTION_ERROR = 5001
 
 
+# Default human-readable message per error code
+ERROR_MESSAGES: Dict[int, str] = {
+    ErrorCodes.SUCCESS: "Success",
+    ErrorCodes.INVALID_REQUEST: "Invalid request",
+    ErrorCodes.INVALID_RESPONSE: "Invalid response",
+    ErrorCodes.TIMEOUT_ERROR: "Request timed out",
+    ErrorCodes.NETWORK_ERROR: "Network error",
+    ErrorCodes.HEARTBEAT_PROCESSING_FAILED: "Heartbeat processing failed",
+    ErrorCodes.TASK_PROCESSING_FAILED: "Task processing failed",
+    ErrorCodes.CHALLENGE_PROCESSING_FAILED: "Challenge processing failed",
+    ErrorCodes.CONFIG_MISSING_KEY: "Missing configuration key",
+    ErrorCodes.CONFIG_INVALID_VALUE: "Invalid configuration value",
+    ErrorCodes.CONFIG_VALIDATION_FAILED: "Configuration validation failed",
+    ErrorCodes.VALIDATION_FAILED: "Validation failed",
+    ErrorCodes.INVALID_SIGNATURE: "Invalid signature",
+    ErrorCodes.INVALID_PROOF: "Invalid proof",
+    ErrorCodes.MERKLE_VERIFICATION_FAILED: "Merkle verification failed",
+    ErrorCodes.SESSION_REQUIRED: "Session required",
+    ErrorCodes.SESSION_UNKNOWN: "Unknown session",
+    ErrorCodes.SESSION_EXPIRED: "Session expired",
+    ErrorCodes.REHANDSHAKE_REQUIRED: "Re-handshake required",
+    ErrorCodes.REPLAY_DETECTED: "Replay detected",
+    ErrorCodes.BAD_AAD: "AAD verification failed",
+    ErrorCodes.BAD_NONCE: "Invalid nonce",
+    ErrorCodes.SEQ_WINDOW_EXCEEDED: "Sequence outside replay window",
+    ErrorCodes.HANDSHAKE_FAILED: "Handshake failed",
+    ErrorCodes.SESSION_LIMIT_EXCEEDED: "Session limit exceeded",
+    ErrorCodes.SEQUENCE_ERROR: "Sequence error",
+    ErrorCodes.DB_ERROR: "Database error",
+    ErrorCodes.DB_CONNECTION_ERROR: "Database connection error",
+}
+
+
 class SystemInfo(StrictModel):
     """System hardware and runtime information for resource assessment"""
 
@@ -101,11 +206,12 @@ class SystemInfo(StrictModel):
     memory_usage: float = Field(default=0.0, description="Memory usage percentage")
     disk_total: int = Field(default=0, description="Total disk space (GB)")
     disk_free: int = Field(default=0, description="Available disk space (GB)")
-    gpu_info: List[Dict[str, Any]] = Field(
-        default_factory=list, description="GPU information list"
+    # Shared empty tuple default; most miner-side instances carry no GPU entries
+    gpu_info: Sequence[Dict[str, Any]] = Field(
+        default=(), description="GPU information list"
     )
-    gpu_plugin: List[Dict[str, Any]] = Field(
-        default_factory=list, description="GPU plugin details with UUIDs"
+    gpu_plugin: Sequence[Dict[str, Any]] = Field(
+        default=(), description="GPU plugin details with UUIDs"
     )
     public_ip: Optional[str] = Field(default=None, description="Public IP address")
 
@@ -133,7 +239,7 @@ class SystemInfo(StrictModel):
     )
 
 
-class WorkerInfo(StrictModel):
+class WorkerInfo(FastStrictModel):
     """Individual worker information"""
 
     worker_id: str = Field(description="Unique worker identifier")
@@ -153,10 +259,10 @@ class WorkerInfo(StrictModel):
         default_factory=SystemInfo, description="Worker system information"
     )
     connected_at: float = Field(
-        default_factory=time.time, description="Connection timestamp"
+        default_factory=_now, description="Connection timestamp"
     )
     last_heartbeat: float = Field(
-        default_factory=time.time, description="Last heartbeat timestamp"
+        default_factory=_now, description="Last heartbeat timestamp"
     )
 
 
@@ -164,7 +270,7 @@ class HeartbeatData(StrictModel):
     """Heartbeat data containing worker status and miner system info"""
 
     hotkey: str = Field(description="Miner hotkey address")
-    timestamp: float = Field(default_factory=time.time, description="Timestamp")
+    timestamp: float = Field(default_factory=_now, description="Timestamp")
     workers: List[WorkerInfo] = Field(description="Connected worker information")
     miner_info: Optional[SystemInfo] = Field(
         default=None, description="Miner host system information (optional)"
@@ -207,7 +313,7 @@ class TaskRequest(StrictModel):
 
     hotkey: str = Field(description="Miner hotkey address")
     request_type: Literal["challenge"] = Field(description="Request type: challenge")
-    timestamp: float = Field(default_factory=time.time, description="Request timestamp")
+    timestamp: float = Field(default_factory=_now, description="Request timestamp")
     schema_version: int = Field(
         default=1, ge=1, description="Schema version for compatibility"
     )
@@ -220,9 +326,7 @@ class TaskResponse(StrictModel):
         description="Task type"
     )
     task_data: Optional[Dict[str, Any]] = Field(default=None, description="Task data")
-    timestamp: float = Field(
-        default_factory=time.time, description="Response timestamp"
-    )
+    timestamp: float = Field(default_factory=_now, description="Response timestamp")
     schema_version: int = Field(
         default=1, ge=1, description="Schema version for compatibility"
     )
@@ -262,21 +366,20 @@ class TaskSynapse(EncryptedSynapse):
     PROTOCOL_TYPE: ClassVar[str] = ProtocolTypes.TASK
 
 
+_HEX_FULLMATCH = re.compile(r"[0-9a-fA-F]+").fullmatch
+
+
 def _is_hex(s: str) -> bool:
-    try:
-        int(s, 16)
-        return True
-    except Exception:
-        return False
+    # Character-class check; avoids building a big int from the whole string
+    return bool(s) and _HEX_FULLMATCH(s) is not None
+
+
+_B64_FULLMATCH = re.compile(r"[A-Za-z0-9+/]+={0,2}").fullmatch
 
 
 def _is_base64(s: str) -> bool:
-    try:
-        # validate without padding issues
-        base64.b64decode(s, validate=True)
-        return True
-    except Exception:
-        return False
+    # Alphabet and padding check only; the value is decoded where it is used
+    return bool(s) and (len(s) & 3) == 0 and _B64_FULLMATCH(s) is not None
 
 
 class SignatureVersion(IntEnum):
@@ -284,7 +387,7 @@ class SignatureVersion(IntEnum):
     GPU = 1
 
 
-class Commitment(StrictModel):
+class Commitment(FastStrictModel):
     """A single commitment object for challenge verification."""
 
     uuid: str = Field(
@@ -332,7 +435,11 @@ class CommitmentData(StrictModel):
     )
 
 
-class ProofRequest(StrictModel):
+# Below this many entries a plain Python scan beats converting to NumPy
+_VECTORIZED_CHECK_MIN_LEN = 64
+
+
+class ProofRequest(FastStrictModel):
     """A single proof request object for Phase 2 verification."""
 
     uuid: str = Field(description="The UUID of the commitment to verify (-1 for CPU).")
@@ -352,19 +459,55 @@ class ProofRequest(StrictModel):
         if not self.rows and not self.coordinates:
             raise ValueError("rows or coordinates must be provided")
         if self.rows:
-            if any(r < 0 for r in self.rows):
+            if len(self.rows) >= _VECTORIZED_CHECK_MIN_LEN:
+                self._check_rows_vectorized()
+            elif any(r < 0 for r in self.rows):
                 raise ValueError("row indices must be non-negative")
         if self.coordinates:
-            for coord in self.coordinates:
-                if len(coord) != 2:
-                    raise ValueError("coordinates must be [row, col] pairs")
-                x, y = coord
-                if x < 0 or y < 0:
-                    raise ValueError("coordinate indices must be non-negative")
+            if len(self.coordinates) >= _VECTORIZED_CHECK_MIN_LEN:
+                self._check_coordinates_vectorized()
+            else:
+                self._check_coordinates(self.coordinates)
         return self
 
+    @staticmethod
+    def _check_coordinates(coordinates: List[List[int]]) -> None:
+        for coord in coordinates:
+            if len(coord) != 2:
+                raise ValueError("coordinates must be [row, col] pairs")
+            x, y = coord
+            if x < 0 or y < 0:
+                raise ValueError("coordinate indices must be non-negative")
+
+    def _check_rows_vectorized(self) -> None:
+        import numpy as np
+
+        try:
+            rows = np.asarray(self.rows, dtype=np.int64)
+        except OverflowError:
+            # Beyond int64 range; fall back to the Python scan
+            if any(r < 0 for r in self.rows):
+                raise ValueError("row indices must be non-negative")
+            return
+        if (rows < 0).any():
+            raise ValueError("row indices must be non-negative")
+
+    def _check_coordinates_vectorized(self) -> None:
+        import numpy as np
 
-class ProofResponse(StrictModel):
+        try:
+            coords = np.asarray(self.coordinates, dtype=np.int64)
+        except (ValueError, OverflowError):
+            # Ragged pairs or values beyond int64; the scalar check reports them
+            self._check_coordinates(self.coordinates)
+            return
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("coordinates must be [row, col] pairs")
+        if (coords < 0).any():
+            raise ValueError("coordinate indices must be non-negative")
+
+
+class ProofResponse(FastStrictModel):
     """A single proof response object for Phase 2 verification."""
 
     uuid: str = Field(description="The UUID of the commitment being verified.")
@@ -394,6 +537,12 @@ class ProofData(StrictModel):
     )
 
 
+# List validators compiled once; each validates a whole list in one core call
+COMMITMENT_LIST_ADAPTER = TypeAdapter(List[Commitment])
+PROOF_REQUEST_LIST_ADAPTER = TypeAdapter(List[ProofRequest])
+PROOF_RESPONSE_LIST_ADAPTER = TypeAdapter(List[ProofResponse])
+
+
 class ChallengeSynapse(EncryptedSynapse):
     """
     Phase 1: Miner sends CommitmentData, Validator responds with a list of ProofRequest objects.
@@ -423,9 +572,7 @@ class HeartbeatResponse(StrictModel):
     )
     message: str = Field(description="Response message")
     workers_processed: int = Field(default=0, description="Number of workers processed")
-    timestamp: float = Field(
-        default_factory=time.time, description="Response timestamp"
-    )
+    timestamp: float = Field(default_factory=_now, description="Response timestamp")
     request_id: Optional[str] = Field(
         default=None, description="Optional request correlation id"
     )
@@ -435,7 +582,7 @@ class HeartbeatResponse(StrictModel):
 
 
 # Session-based encryption protocol classes
-class SessionInitRequest(StrictModel):
+class SessionInitRequest(FastStrictModel):
     """Session initialization request data for ECDH key exchange"""
 
     miner_eph_pub32: str = Field(
@@ -443,28 +590,44 @@ class SessionInitRequest(StrictModel):
     )
     client_nonce16: str = Field(description="Base64 encoded client nonce (16 bytes)")
     created_at: float = Field(
-        default_factory=time.time, description="Request creation timestamp"
+        default_factory=_now, description="Request creation timestamp"
     )
 
+    # Decoded bytes kept from validation so consumers need not decode again
+    _raw_pub: bytes = PrivateAttr(default=b"")
+    _raw_nonce: bytes = PrivateAttr(default=b"")
+
     @model_validator(mode="after")
     def validate_session_init(self) -> "SessionInitRequest":
         # 32 bytes public key
         try:
-            raw_pub = base64.b64decode(self.miner_eph_pub32, validate=True)
+            raw_pub = _b64decode(self.miner_eph_pub32, validate=True)
         except binascii.Error as e:
             raise ValueError("miner_eph_pub32 must be valid base64") from e
         if len(raw_pub) != 32:
             raise ValueError("miner_eph_pub32 must decode to 32 bytes")
         try:
-            raw_nonce = base64.b64decode(self.client_nonce16, validate=True)
+            raw_nonce = _b64decode(self.client_nonce16, validate=True)
         except binascii.Error as e:
             raise ValueError("client_nonce16 must be valid base64") from e
         if len(raw_nonce) != 16:
             raise ValueError("client_nonce16 must decode to 16 bytes")
+        self._raw_pub = raw_pub
+        self._raw_nonce = raw_nonce
         return self
 
+    @property
+    def raw_pub(self) -> bytes:
+        """Decoded miner_eph_pub32 (32 bytes)"""
+        return self._raw_pub
+
+    @property
+    def raw_nonce(self) -> bytes:
+        """Decoded client_nonce16 (16 bytes)"""
+        return self._raw_nonce
+
 
-class SessionInitResponse(StrictModel):
+class SessionInitResponse(FastStrictModel):
     """Session initialization response data"""
 
     validator_eph_pub32: str = Field(
@@ -476,24 +639,40 @@ class SessionInitResponse(StrictModel):
     server_nonce16: str = Field(description="Base64 encoded server nonce (16 bytes)")
     expires_at: float = Field(description="Session expiration timestamp")
 
+    # Decoded bytes kept from validation so consumers need not decode again
+    _raw_pub: bytes = PrivateAttr(default=b"")
+    _raw_nonce: bytes = PrivateAttr(default=b"")
+
     @model_validator(mode="after")
     def validate_session_response(self) -> "SessionInitResponse":
         try:
-            raw_pub = base64.b64decode(self.validator_eph_pub32, validate=True)
+            raw_pub = _b64decode(self.validator_eph_pub32, validate=True)
         except binascii.Error as e:
             raise ValueError("validator_eph_pub32 must be valid base64") from e
         if len(raw_pub) != 32:
             raise ValueError("validator_eph_pub32 must decode to 32 bytes")
         try:
-            raw_nonce = base64.b64decode(self.server_nonce16, validate=True)
+            raw_nonce = _b64decode(self.server_nonce16, validate=True)
         except binascii.Error as e:
             raise ValueError("server_nonce16 must be valid base64") from e
         if len(raw_nonce) != 16:
             raise ValueError("server_nonce16 must decode to 16 bytes")
         if not self.session_id:
             raise ValueError("session_id required")
+        self._raw_pub = raw_pub
+        self._raw_nonce = raw_nonce
         return self
 
+    @property
+    def raw_pub(self) -> bytes:
+        """Decoded validator_eph_pub32 (32 bytes)"""
+        return self._raw_pub
+
+    @property
+    def raw_nonce(self) -> bytes:
+        """Decoded server_nonce16 (16 bytes)"""
+        return self._raw_nonce
+
 
 class SessionInitSynapse(bt.Synapse):
     """Session initialization synapse (plaintext, relies on Bittensor signature)"""
@@ -521,7 +700,7 @@ class ProtocolRegistry:
         protocol_key = getattr(synapse_cls, "PROTOCOL_TYPE")
         if not isinstance(protocol_key, str) or not protocol_key:
             raise ValueError("PROTOCOL_TYPE must be non-empty string")
-        cls._registry[protocol_key] = synapse_cls
+        cls._registry[sys.intern(protocol_key)] = synapse_cls
         return synapse_cls
 
     @classmethod
@@ -544,8 +723,11 @@ __all__ = [
     # constants and codes
     "ProtocolTypes",
     "ErrorCodes",
+    "ERROR_MESSAGES",
     # base
     "StrictModel",
+    "frozen_clock",
+    "FastStrictModel",
     "CommunicationResult",
     # system and worker
     "SystemInfo",
@@ -558,6 +740,9 @@ __all__ = [
     "ProofRequest",
     "ProofResponse",
     "ProofData",
+    "COMMITMENT_LIST_ADAPTER",
+    "PROOF_REQUEST_LIST_ADAPTER",
+    "PROOF_RESPONSE_LIST_ADAPTER",
     # synapses
     "EncryptedSynapse",
     "HeartbeatSynapse",
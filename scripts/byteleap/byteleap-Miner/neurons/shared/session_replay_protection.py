@@ -1,22 +1,33 @@
 """
 Session Replay Protection
 Common constants and sliding window logic for sequence validation
+
+Fully annotated and free of dynamic attribute tricks so the module can be
+compiled as-is with mypyc (``mypyc neurons/shared/session_replay_protection.py``).
 """
 
-from collections import deque
-from typing import Deque, Optional, Set
+from array import array
+from typing import Final, Optional, Set
 
 import bittensor as bt
 
 from neurons.shared.crypto import CryptoManager
 
 # Session sequence constants
-MAX_SEQ = 2**64 - 1  # 8-byte sequence number limit for AES-GCM nonce safety
+MAX_SEQ: Final = 2**64 - 1  # 8-byte sequence number limit for AES-GCM nonce safety
 
 
 class SlidingWindowValidator:
     """Sliding window replay protection with O(1) lookups"""
 
+    window_size: int
+    recv_seq: int
+    # Fixed-size ring of the last window_size accepted sequences (uint64)
+    replay_window: Optional["array[int]"]
+    replay_set: Optional[Set[int]]
+    _ring_pos: int
+    _ring_filled: int
+
     def __init__(self, window_size: Optional[int] = None):
         """
         Initialize sliding window validator
@@ -26,13 +37,15 @@ class SlidingWindowValidator:
         """
         self.window_size = window_size or CryptoManager.REPLAY_WINDOW_SIZE
         self.recv_seq = 0  # Highest sequence received
+        self._ring_pos = 0  # Next slot to write
+        self._ring_filled = 0  # Number of valid slots
 
         if self.window_size > 0:
-            self.replay_window: Optional[Deque[int]] = deque(maxlen=self.window_size)
-            self.replay_set: Optional[Set[int]] = set()  # O(1) membership checking
+            self.replay_window = array("Q", [0]) * self.window_size
+            self.replay_set = set()  # O(1) membership checking
         else:
-            self.replay_window: Optional[Deque[int]] = None
-            self.replay_set: Optional[Set[int]] = None
+            self.replay_window = None
+            self.replay_set = None
 
     def validate_sequence(self, seq: int, context_name: str = "") -> bool:
         """
@@ -60,32 +73,36 @@ class SlidingWindowValidator:
             )
             return False
 
-        # Check if sequence is too old using fixed window boundary
-        window_left_boundary = max(0, self.recv_seq - self.window_size + 1)
-        if seq < window_left_boundary:
-            bt.logging.warning(
-                f"Sequence too old{' from ' + context_name if context_name else ''}: seq={seq}, boundary={window_left_boundary}"
-            )
-            return False
-
-        # Check for excessive forward jump to prevent DoS
+        # Single range test covering both the fixed window boundary (too old)
+        # and the forward-jump DoS limit; only classify when it fails
+        recv_seq = self.recv_seq
+        window_left_boundary = max(0, recv_seq - self.window_size + 1)
         max_forward_jump = self.window_size * 2  # Allow reasonable forward jumps
-        if seq > self.recv_seq + max_forward_jump:
-            bt.logging.warning(
-                f"Sequence forward jump too large{' from ' + context_name if context_name else ''}: seq={seq}, current={self.recv_seq}, max_jump={max_forward_jump}"
-            )
+        if not window_left_boundary <= seq <= recv_seq + max_forward_jump:
+            if seq < window_left_boundary:
+                bt.logging.warning(
+                    f"Sequence too old{' from ' + context_name if context_name else ''}: seq={seq}, boundary={window_left_boundary}"
+                )
+            else:
+                bt.logging.warning(
+                    f"Sequence forward jump too large{' from ' + context_name if context_name else ''}: seq={seq}, current={recv_seq}, max_jump={max_forward_jump}"
+                )
             return False
 
         # Update sequence tracking
-        self.recv_seq = max(self.recv_seq, seq)
-
-        # Manage sliding window with deque+set synchronization
-        if len(self.replay_window) == self.window_size:
-            # Remove oldest entry from set when deque evicts it
-            oldest_seq = self.replay_window[0]
-            self.replay_set.discard(oldest_seq)
+        if seq > recv_seq:
+            self.recv_seq = seq
+
+        # Manage sliding window with ring+set synchronization
+        pos = self._ring_pos
+        if self._ring_filled == self.window_size:
+            # Slot being overwritten holds the oldest entry
+            self.replay_set.discard(self.replay_window[pos])
+        else:
+            self._ring_filled += 1
 
-        self.replay_window.append(seq)
+        self.replay_window[pos] = seq
+        self._ring_pos = pos + 1 if pos + 1 < self.window_size else 0
         self.replay_set.add(seq)
         return True
 
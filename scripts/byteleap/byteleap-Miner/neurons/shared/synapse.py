@@ -3,11 +3,18 @@ Synapse Validation and Processing
 Handles synapse validation and address extraction logic
 """
 
+from functools import lru_cache
 from typing import Any
 
 import bittensor as bt
 
 
+@lru_cache(maxsize=1024)
+def _format_peer_address(ip: Any, port: Any) -> str:
+    """Format and memoize an ip:port string; peers repeat across requests"""
+    return f"{ip}:{port}"
+
+
 class SynapseHandler:
     """Handles synapse validation and processing"""
 
@@ -36,17 +43,12 @@ class SynapseHandler:
         Returns:
             Peer address string
         """
-        ip = (
-            getattr(synapse.dendrite, "ip", "unknown")
-            if synapse.dendrite
-            else "unknown"
+        dendrite = synapse.dendrite
+        if not dendrite:
+            return "unknown:unknown"
+        return _format_peer_address(
+            getattr(dendrite, "ip", "unknown"), getattr(dendrite, "port", "unknown")
         )
-        port = (
-            getattr(synapse.dendrite, "port", "unknown")
-            if synapse.dendrite
-            else "unknown"
-        )
-        return f"{ip}:{port}"
 
     def is_response_valid(self, synapse_response: Any) -> bool:
         """
@@ -64,16 +66,22 @@ class SynapseHandler:
         if isinstance(synapse_response, str):
             return False
 
-        if hasattr(synapse_response, "dendrite"):
+        try:
             dendrite = synapse_response.dendrite
-            if dendrite and hasattr(dendrite, "status_code"):
+        except AttributeError:
+            return True
+
+        if dendrite:
+            try:
                 if dendrite.status_code != 200:
                     return False
+            except AttributeError:
+                pass
 
-            if hasattr(synapse_response, "response"):
-                return synapse_response.response is not None
-
-        return True
+        try:
+            return synapse_response.response is not None
+        except AttributeError:
+            return True
 
     def get_response_error(self, synapse_response: Any) -> str:
         """
@@ -91,12 +99,13 @@ class SynapseHandler:
         if isinstance(synapse_response, str):
             return "Connection failed"
 
-        if hasattr(synapse_response, "dendrite"):
+        try:
             dendrite = synapse_response.dendrite
-            if dendrite and hasattr(dendrite, "status_code"):
-                if dendrite.status_code != 200:
-                    return getattr(
-                        dendrite, "status_message", f"HTTP {dendrite.status_code}"
-                    )
+            status_code = dendrite.status_code if dendrite else 200
+        except AttributeError:
+            return "Unknown error"
+
+        if status_code != 200:
+            return getattr(dendrite, "status_message", f"HTTP {status_code}")
 
         return "Unknown error"
@@ -2,13 +2,37 @@
 Standardized error handling utilities for consistent logging and error management
 """
 
+import logging
 import traceback
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import bittensor as bt
 
 
+def _level_enabled(level: int) -> bool:
+    """Whether bittensor's logger emits records at level (NOTSET emits all)"""
+    return bt.logging.get_level() <= level
+
+
+# "k1={}, k2={}" templates keyed by context key order; call sites reuse a few shapes
+_CONTEXT_TEMPLATES: Dict[Tuple[Any, ...], str] = {}
+_CONTEXT_TEMPLATES_MAX = 256
+
+
+def _format_context(context: dict) -> str:
+    """Render context as 'k1=v1, k2=v2' using a cached per-shape template"""
+    keys = tuple(context)
+    template = _CONTEXT_TEMPLATES.get(keys)
+    if template is None:
+        template = ", ".join(
+            str(k).replace("{", "{{").replace("}", "}}") + "={}" for k in keys
+        )
+        if len(_CONTEXT_TEMPLATES) < _CONTEXT_TEMPLATES_MAX:
+            _CONTEXT_TEMPLATES[keys] = template
+    return template.format(*context.values())
+
+
 class ErrorHandler:
     """Centralized error handling utilities"""
 
@@ -26,15 +50,20 @@ class ErrorHandler:
             operation: Description of the operation that failed
             error: The exception that occurred
             context: Additional context information
-            include_traceback: Whether to include full traceback
+            include_traceback: Whether to include full traceback (DEBUG only)
         """
-        error_msg = f"Error in {operation}: {str(error)}"
+        # Skip message formatting entirely when errors are filtered out
+        if not _level_enabled(logging.ERROR):
+            return
+
+        error_msg = f"Error in {operation}: {error}"
 
         if context:
-            context_str = ", ".join(f"{k}={v}" for k, v in context.items())
+            context_str = _format_context(context)
             error_msg += f" (Context: {context_str})"
 
-        if include_traceback:
+        # Traceback formatting walks every frame; only pay for it when debugging
+        if include_traceback and _level_enabled(logging.DEBUG):
             bt.logging.exception(error_msg)
         else:
             bt.logging.error(error_msg)
@@ -51,10 +80,13 @@ class ErrorHandler:
             message: Warning message
             context: Additional context information
         """
+        if not _level_enabled(logging.WARNING):
+            return
+
         warning_msg = f"Warning in {operation}: {message}"
 
         if context:
-            context_str = ", ".join(f"{k}={v}" for k, v in context.items())
+            context_str = _format_context(context)
             warning_msg += f" (Context: {context_str})"
 
         bt.logging.warning(warning_msg)
@@ -66,6 +98,7 @@ class ErrorHandler:
         default_return: Any = None,
         context: Optional[dict] = None,
         reraise: bool = False,
+        include_traceback: bool = False,
     ) -> Any:
         """
         Execute function with standardized error handling
@@ -76,6 +109,7 @@ class ErrorHandler:
             default_return: Default return value on error
             context: Additional context for logging
             reraise: Whether to re-raise the exception after logging
+            include_traceback: Whether to log the full traceback
 
         Returns:
             Function result or default_return on error
@@ -83,14 +117,17 @@ class ErrorHandler:
         try:
             return func()
         except Exception as e:
-            ErrorHandler.log_error(operation_name, e, context, include_traceback=True)
+            ErrorHandler.log_error(operation_name, e, context, include_traceback)
             if reraise:
                 raise
             return default_return
 
     @staticmethod
     def async_error_handler(
-        operation_name: str, context: Optional[dict] = None, reraise: bool = True
+        operation_name: str,
+        context: Optional[dict] = None,
+        reraise: bool = True,
+        include_traceback: bool = False,
     ):
         """
         Decorator for standardized async error handling
@@ -99,6 +136,7 @@ class ErrorHandler:
             operation_name: Name of operation for logging
             context: Additional context for logging
             reraise: Whether to re-raise exceptions
+            include_traceback: Whether to log the full traceback
         """
 
         def decorator(func):
@@ -108,7 +146,7 @@ class ErrorHandler:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     ErrorHandler.log_error(
-                        operation_name, e, context, include_traceback=True
+                        operation_name, e, context, include_traceback
                     )
                     if reraise:
                         raise
@@ -124,6 +162,7 @@ class ErrorHandler:
         context: Optional[dict] = None,
         reraise: bool = True,
         default_return: Any = None,
+        include_traceback: bool = False,
     ):
         """
         Decorator for standardized sync error handling
@@ -133,6 +172,7 @@ class ErrorHandler:
             context: Additional context for logging
             reraise: Whether to re-raise exceptions
             default_return: Default return value on error
+            include_traceback: Whether to log the full traceback
         """
 
         def decorator(func):
@@ -142,7 +182,7 @@ class ErrorHandler:
                     return func(*args, **kwargs)
                 except Exception as e:
                     ErrorHandler.log_error(
-                        operation_name, e, context, include_traceback=True
+                        operation_name, e, context, include_traceback
                     )
                     if reraise:
                         raise
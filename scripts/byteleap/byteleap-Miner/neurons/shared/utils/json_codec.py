@@ -0,0 +1,43 @@
+"""
+JSON Codec
+Fast JSON encoding/decoding for message payloads, using orjson when installed
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Keep stdlib-compatible output for dicts with int keys (e.g. row indices)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Deserialize JSON from str or bytes
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,20 +5,12 @@ Provides efficient cryptographic proofs for row-based computation verification
 
 import hashlib
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
 
 import bittensor as bt
 
-
-@dataclass
-class MerkleNode:
-    """A node in the Merkle tree"""
-
-    hash_value: str
-    left_child: Optional["MerkleNode"] = None
-    right_child: Optional["MerkleNode"] = None
-    is_leaf: bool = False
-    leaf_index: Optional[int] = None  # Only set for leaf nodes
+# Length of a sha256 hexdigest; every level above the leaves has this width
+_DIGEST_HEX_LEN = 64
 
 
 @dataclass
@@ -54,7 +46,9 @@ class MerkleTree:
 
         self.leaf_hashes = leaf_hashes.copy()
         self.leaf_count = len(leaf_hashes)
-        self.root: Optional[MerkleNode] = None
+        # Hashes per level from leaves to root, odd levels padded with their last
+        # hash, so the sibling of node i on any level below the root is i ^ 1
+        self._levels: List[List[str]] = []
 
         # Build the tree
         self._build_tree()
@@ -62,58 +56,55 @@ class MerkleTree:
         bt.logging.debug(f"Built Merkle tree with {self.leaf_count} leaves")
 
     def _build_tree(self) -> None:
-        """Build the Merkle tree from leaf hashes"""
-
-        # Create leaf nodes
-        current_level = []
-        for i, leaf_hash in enumerate(self.leaf_hashes):
-            leaf_node = MerkleNode(hash_value=leaf_hash, is_leaf=True, leaf_index=i)
-            current_level.append(leaf_node)
+        """Build the Merkle tree from leaf hashes, hashing a whole level per pass"""
+        level_hashes = self.leaf_hashes
 
         # Build tree level by level
-        while len(current_level) > 1:
-            next_level = []
-
-            # Process pairs of nodes
-            for i in range(0, len(current_level), 2):
-                left_child = current_level[i]
-
-                if i + 1 < len(current_level):
-                    # We have a pair
-                    right_child = current_level[i + 1]
-                else:
-                    # Odd number of nodes - duplicate the last one
-                    right_child = current_level[i]
+        while len(level_hashes) > 1:
+            if len(level_hashes) % 2:
+                # Odd number of nodes - duplicate the last one
+                level_hashes = level_hashes + [level_hashes[-1]]
 
-                # Create parent node
-                combined_hash = self._hash_pair(
-                    left_child.hash_value, right_child.hash_value
-                )
-                parent_node = MerkleNode(
-                    hash_value=combined_hash,
-                    left_child=left_child,
-                    right_child=right_child,
-                    is_leaf=False,
-                )
+            self._levels.append(level_hashes)
+            if len(self._levels) == 1:
+                level_hashes = self._hash_level(level_hashes)
+            else:
+                level_hashes = self._hash_digest_level(level_hashes)
 
-                next_level.append(parent_node)
+        # Root level
+        self._levels.append(level_hashes)
 
-            current_level = next_level
+    @staticmethod
+    def _hash_level(level_hashes: List[str]) -> List[str]:
+        """Hash adjacent pairs of an even-length level to create the parent level"""
+        sha256 = hashlib.sha256
+        return [
+            sha256((left_hash + right_hash).encode("utf-8")).hexdigest()
+            for left_hash, right_hash in zip(level_hashes[0::2], level_hashes[1::2])
+        ]
 
-        # Set the root
-        self.root = current_level[0]
+    @staticmethod
+    def _hash_digest_level(level_hashes: List[str]) -> List[str]:
+        """
+        Same as _hash_level for an even-length level of sha256 hexdigests
 
-    def _hash_pair(self, left_hash: str, right_hash: str) -> str:
-        """Hash a pair of child hashes to create parent hash"""
-        # Concatenate and hash
-        combined = left_hash + right_hash
-        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+        Encodes the level once and hashes fixed-width slices, instead of building
+        and encoding a new concatenated string per pair. Leaf hashes may have any
+        width, so the leaf level always goes through _hash_level.
+        """
+        sha256 = hashlib.sha256
+        pair_len = 2 * _DIGEST_HEX_LEN
+        data = "".join(level_hashes).encode("ascii")
+        return [
+            sha256(data[i : i + pair_len]).hexdigest()
+            for i in range(0, len(data), pair_len)
+        ]
 
     def get_root_hash(self) -> str:
         """Get the Merkle root hash"""
-        if not self.root:
+        if not self._levels:
             raise RuntimeError("Tree not built")
-        return self.root.hash_value
+        return self._levels[-1][0]
 
     def generate_proof(self, leaf_index: int) -> MerkleProof:
         """
@@ -130,16 +121,19 @@ class MerkleTree:
                 f"leaf_index {leaf_index} out of range [0, {self.leaf_count})"
             )
 
-        if not self.root:
+        if not self._levels:
             raise RuntimeError("Tree not built")
 
         # Collect proof hashes and directions from leaf to root
         proof_hashes = []
         proof_directions = []
 
-        self._collect_proof_path_bottom_up(
-            self.root, leaf_index, proof_hashes, proof_directions
-        )
+        index = leaf_index
+        for level_hashes in self._levels[:-1]:
+            proof_hashes.append(level_hashes[index ^ 1])
+            # A left child (even index) has its sibling on the right
+            proof_directions.append(not index & 1)
+            index >>= 1
 
         return MerkleProof(
             leaf_index=leaf_index,
@@ -148,60 +142,6 @@ class MerkleTree:
             proof_directions=proof_directions,
         )
 
-    def _contains_leaf_index(
-        self, node: Optional[MerkleNode], target_index: int
-    ) -> bool:
-        """Check if a subtree contains a specific leaf index"""
-        if not node:
-            return False
-
-        if node.is_leaf:
-            return node.leaf_index == target_index
-
-        # Check both children
-        return self._contains_leaf_index(
-            node.left_child, target_index
-        ) or self._contains_leaf_index(node.right_child, target_index)
-
-    def _collect_proof_path_bottom_up(
-        self,
-        node: MerkleNode,
-        target_index: int,
-        proof_hashes: List[str],
-        proof_directions: List[bool],
-    ) -> bool:
-        """
-        Collect proof path from leaf to root (natural verification order)
-
-        Returns True if target was found in this subtree
-        """
-        if node.is_leaf:
-            return node.leaf_index == target_index
-
-        # Check which child contains our target
-        left_contains_target = self._contains_leaf_index(node.left_child, target_index)
-
-        if left_contains_target:
-            # Target is in left subtree
-            found = self._collect_proof_path_bottom_up(
-                node.left_child, target_index, proof_hashes, proof_directions
-            )
-            if found:
-                # Right sibling hash for verification path
-                proof_hashes.append(node.right_child.hash_value)
-                proof_directions.append(True)  # Right sibling
-            return found
-        else:
-            # Target is in right subtree
-            found = self._collect_proof_path_bottom_up(
-                node.right_child, target_index, proof_hashes, proof_directions
-            )
-            if found:
-                # Left sibling hash for verification path
-                proof_hashes.append(node.left_child.hash_value)
-                proof_directions.append(False)  # Left sibling
-            return found
-
     def generate_batch_proofs(self, leaf_indices: List[int]) -> List[MerkleProof]:
         """
         Generate proofs for multiple leaves efficiently
@@ -0,0 +1,91 @@
+"""
+YAML Config Cache
+Reuse a cached parse of a YAML config file until the file changes
+"""
+
+import hashlib
+import marshal
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Tuple
+
+import yaml
+
+try:
+    # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def _cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME/byteleap)"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "byteleap"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Owned by the current user and not writable by group or others"""
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def load_yaml_cached(config_path: str) -> Any:
+    """
+    Load a YAML file, skipping the parse when an up-to-date cached copy exists
+
+    The cache entry is keyed on (real path, st_mtime_ns, st_size) and stored
+    with marshal, which only round-trips plain data. Entries are only read
+    from a directory and file owned by the current user and not writable by
+    anyone else; any cache problem falls back to a plain parse.
+
+    Raises:
+        OSError: If the config file cannot be read
+        yaml.YAMLError: If the config file is not valid YAML
+    """
+    real_path = os.path.realpath(config_path)
+    st = os.stat(real_path)
+    stamp: Tuple[str, int, int] = (real_path, st.st_mtime_ns, st.st_size)
+    cache_dir = _cache_dir()
+    cache_file = (
+        cache_dir / f"{hashlib.sha256(real_path.encode()).hexdigest()[:32]}.marshal"
+    )
+
+    try:
+        if _is_private(os.lstat(cache_dir)):
+            with open(cache_file, "rb") as f:
+                if _is_private(os.fstat(f.fileno())):
+                    cached_stamp, data = marshal.load(f)
+                    if cached_stamp == stamp:
+                        return data
+    except Exception:
+        pass  # Missing, foreign or corrupt cache: parse instead
+
+    with open(real_path, "rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    tmp_path = None
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private(os.lstat(cache_dir)):
+            return data
+        # Raises ValueError for non-plain values (e.g. YAML timestamps)
+        payload = marshal.dumps((stamp, data))
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_file)
+        tmp_path = None
+    except Exception:
+        pass  # Caching is best effort
+    finally:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    return data
@@ -4,18 +4,33 @@ IPC client for communication with CUDA GPU server via Unix Domain Socket
 """
 
 import json
+import mmap
 import os
 import socket
 import struct
 import subprocess
+import sys
 import threading
 import time
+from array import array
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import bittensor as bt
 from loguru import logger
 
+from neurons.shared.utils import json_codec
+
+# Little-endian uint32 length prefix used by the stream framing
+_HDR_STRUCT = struct.Struct("<I")
+
+# Wire-level ping/pong for protocol v2 servers on seqpacket sockets
+_PING_SENTINEL = b"\x00"
+_PONG_SENTINEL = b"\x01"
+
+# Ancillary buffer for one SCM_RIGHTS descriptor (memfd row payloads)
+_FD_ANC_SIZE = socket.CMSG_SPACE(array("i").itemsize)
+
 
 class GPUServerError(Exception):
     """GPU server communication error"""
@@ -39,6 +54,12 @@ class GPUServerClient:
     COMMAND_TIMEOUT = 300
     PING_INTERVAL = 60
     STARTUP_TIMEOUT = 30
+    STARTUP_POLL_MIN = 0.01
+    STARTUP_POLL_MAX = 0.5
+    ALIVE_CHECK_TTL = 1.0
+
+    # Largest reply accepted from the server
+    MAX_RESPONSE_SIZE = 16 * 1024 * 1024
 
     # GPU server lifecycle
     RESTART_DELAY = 5
@@ -53,19 +74,65 @@ class GPUServerClient:
         self.config = config
         # GPU server binary configuration from config
         self.gpu_binary_path = config.get("gpu.binary_path")
+        # Resolved once; the filesystem walk result does not change at runtime
+        self._resolved_binary_path = self._resolve_binary_path(self.gpu_binary_path)
         self.socket_path = config.get("gpu.socket_path")
+        # Linux abstract namespace: connect by name without a filesystem lookup
+        self.abstract_socket = config.get_optional("gpu.abstract_socket", False)
+        if self.abstract_socket:
+            self._socket_address = "\0" + self.socket_path
+            self._server_socket_arg = "@" + self.socket_path
+        else:
+            self._socket_address = self.socket_path
+            self._server_socket_arg = self.socket_path
         self.enable_gpu = config.get("gpu.enable")
         self.auto_start = config.get("gpu.auto_start")
+        # Opt-in: ask for row data as raw float32 instead of JSON number lists
+        self.binary_rows = config.get_optional("gpu.binary_rows", False)
+        # Opt-in: receive row payloads through a shared memfd passed over the socket
+        self.memfd_rows = config.get_optional("gpu.memfd_rows", False)
+        if self.memfd_rows:
+            self._row_format: Optional[str] = "memfd"
+        elif self.binary_rows:
+            self._row_format = "binary"
+        else:
+            self._row_format = None
+        # "seqpacket" uses kernel message boundaries instead of length prefixes
+        self.seqpacket = config.get_optional("gpu.protocol", "stream") == "seqpacket"
+        # Socket buffer size so large row replies need fewer kernel wakeups
+        self.uds_bufsize = config.get_optional(
+            "gpu.uds_bufsize", self.MAX_RESPONSE_SIZE
+        )
+        # Concurrent server connections, so per-GPU queries can overlap
+        self.pool_size = max(1, int(config.get_optional("gpu.pool_size", 4)))
+        # Whether the server implements get_result_batch; None until probed
+        self._batch_supported: Optional[bool] = None
+        # Whether the server accepts the 1-byte seqpacket ping; None until probed
+        self._fast_ping: Optional[bool] = None
 
         # Runtime state
         self.gpu_process: Optional[subprocess.Popen] = None
+        # Monotonic time of the last positive process liveness check
+        self._alive_checked_at = 0.0
         self.is_connected = False
-        self.last_ping_time = 0
+        # Monotonic time of the last successful exchange with the server
+        self.last_ping_time = 0.0
         self.connection_lock = threading.Lock()
+        self._ping_lock = threading.Lock()
+
+        # Pool of long-lived server sockets reused across commands; guarded
+        # separately because connection_lock is held across ping() calls
+        self._idle_socks: List[socket.socket] = []
+        self._sock_lock = threading.Lock()
+        self._sock_slots = threading.BoundedSemaphore(self.pool_size)
+        # Bumped when the pool is closed so in-flight sockets are not re-pooled
+        self._pool_generation = 0
 
         # GPU information cache
         self.gpu_info: Optional[Dict[str, Any]] = None
         self.gpu_uuids: List[str] = []
+        # Round-trip of a ping on a warm connection, measured after connecting
+        self.steady_state_ping_us: Optional[float] = None
 
         logger.debug(f"🧮 GPU client init | binary={self.gpu_binary_path}")
 
@@ -98,10 +165,15 @@ class GPUServerClient:
             if potential_binary.exists():
                 return potential_binary
 
-            # Check for project root indicators
-            has_bin = (search_path / "bin").is_dir()
-            has_setup = (search_path / "setup.py").exists()
-            has_claude = (search_path / "CLAUDE.md").exists()
+            # Check for project root indicators with one directory listing
+            try:
+                with os.scandir(search_path) as entries:
+                    names = {entry.name: entry for entry in entries}
+            except OSError:
+                names = {}
+            has_bin = "bin" in names and names["bin"].is_dir()
+            has_setup = "setup.py" in names
+            has_claude = "CLAUDE.md" in names
 
             if has_bin or has_setup or has_claude:
                 potential_binary = search_path / binary_path.lstrip("./")
@@ -120,8 +192,34 @@ class GPUServerClient:
         if not self.enable_gpu:
             return False
 
-        with self.connection_lock:
-            return self.is_connected and self._is_server_responsive()
+        # A recent successful command stands in for a ping
+        if (
+            self.is_connected
+            and time.monotonic() - self.last_ping_time < self.PING_INTERVAL
+        ):
+            return True
+
+        if not self.is_connected:
+            return False
+
+        # Ping outside connection_lock so process lifecycle calls and other
+        # commands are not serialized behind a network round-trip; one ping
+        # at a time, and waiters reuse its result
+        with self._ping_lock:
+            if time.monotonic() - self.last_ping_time < self.PING_INTERVAL:
+                return self.is_connected
+            return self._is_server_responsive()
+
+    def _ensure_connected(self) -> Optional[str]:
+        """
+        Make sure the server is usable before a command
+
+        Returns:
+            None when connected, otherwise an error message
+        """
+        if self.is_available() or self.connect():
+            return None
+        return "GPU server not available"
 
     def start_gpu_server(self) -> bool:
         """
@@ -144,11 +242,12 @@ class GPUServerClient:
                 logger.debug("GPU server running and responsive")
                 return True
 
-            # Clean up any existing process
+            # Clean up any existing process and its connection
+            self._close_pool()
             self._cleanup_gpu_process()
 
             # Validate binary path with intelligent resolution
-            binary_path = self._resolve_binary_path(self.gpu_binary_path)
+            binary_path = self._resolved_binary_path
             if not binary_path.exists():
                 logger.error(f"❌ GPU binary not found | path={binary_path}")
                 logger.error(f"❌ Working directory: {Path.cwd()}")
@@ -164,7 +263,7 @@ class GPUServerClient:
 
                 # Start GPU server with socket path (ensure absolute path)
                 absolute_binary_path = binary_path.resolve()
-                cmd = [str(absolute_binary_path), "--socket", self.socket_path]
+                cmd = [str(absolute_binary_path), "--socket", self._server_socket_arg]
 
                 self.gpu_process = subprocess.Popen(
                     cmd,
@@ -174,9 +273,11 @@ class GPUServerClient:
                     preexec_fn=os.setsid,  # Create new process group
                 )
 
-                # Wait for server to start and become responsive
-                start_time = time.time()
-                while time.time() - start_time < self.STARTUP_TIMEOUT:
+                # Wait for server to start and become responsive, polling with
+                # exponential backoff so a fast start is noticed quickly
+                start_time = time.monotonic()
+                delay = self.STARTUP_POLL_MIN
+                while time.monotonic() - start_time < self.STARTUP_TIMEOUT:
                     # Check if process is still alive
                     if self.gpu_process.poll() is not None:
                         # Process has terminated
@@ -196,9 +297,11 @@ class GPUServerClient:
 
                         # Cache GPU information
                         self._refresh_gpu_info()
+                        self._warm_up()
                         return True
 
-                    time.sleep(1)
+                    time.sleep(delay)
+                    delay = min(delay * 2, self.STARTUP_POLL_MAX)
 
                 # Server didn't become responsive in time
                 logger.error("❌ GPU server unresponsive within timeout")
@@ -213,6 +316,7 @@ class GPUServerClient:
     def stop_gpu_server(self) -> None:
         """Stop GPU server gracefully"""
         with self.connection_lock:
+            self._close_pool()
             self._cleanup_gpu_process()
             self.is_connected = False
             logger.info("⏹️ GPU server stopped")
@@ -231,6 +335,7 @@ class GPUServerClient:
         if self._is_server_responsive():
             self.is_connected = True
             self._refresh_gpu_info()
+            self._warm_up()
             return True
 
         # Try to start server if auto_start is enabled
@@ -277,7 +382,7 @@ class GPUServerClient:
                     "gpu_details": gpus,
                 }
                 self.gpu_uuids = gpu_uuids
-                logger.debug(f"GPU info | count={gpu_count}")
+                logger.debug("GPU info | count={}", gpu_count)
                 return self.gpu_info
             else:
                 logger.error(f"❌ GPU info error | resp={response}")
@@ -301,13 +406,9 @@ class GPUServerClient:
         Returns:
             Challenge result data
         """
-        if not self.is_available():
-            if not self.connect():
-                return {
-                    "success": False,
-                    "error": "GPU server not available",
-                    "results": [],
-                }
+        error = self._ensure_connected()
+        if error:
+            return {"success": False, "error": error, "results": []}
 
         try:
             # Convert seed to hex string if it's bytes
@@ -380,31 +481,65 @@ class GPUServerClient:
             Response with coordinate values in List[float] format
             Data layout: [coord_values...][row1_values...][row2_values...]
         """
-        if not self.is_available():
-            if not self.connect():
-                return {"success": False, "error": "GPU server not available"}
+        error = self._ensure_connected()
+        if error:
+            return {"success": False, "error": error}
 
         try:
             coord_queries = coordinates or []
             row_queries = rows or []
 
+            # loguru formats deferred arguments only if a sink accepts DEBUG
             logger.debug(
-                f"🔎 GPU query | coords={len(coord_queries)} rows={len(row_queries)} uuid={gpu_uuid}"
+                "🔎 GPU query | coords={} rows={} uuid={}",
+                len(coord_queries),
+                len(row_queries),
+                gpu_uuid,
             )
 
             all_values = []
+            coord_response = row_response = None
 
-            # Get coordinate values using get_result_coords API
-            if coord_queries:
-                coord_request = {
-                    "command": "get_result_coords",
+            # Fetch coords and rows in one round-trip when the server supports it
+            if coord_queries and row_queries and self._batch_supported is not False:
+                batch_request = {
+                    "command": "get_result_batch",
                     "gpu_uuid": gpu_uuid,
                     "queries": coord_queries,
+                    "row_indices": row_queries,
                 }
+                if self._row_format:
+                    batch_request["format"] = self._row_format
 
-                coord_response = self._send_command(
-                    coord_request, timeout=timeout or self.COMMAND_TIMEOUT
+                batch_response = self._send_command(
+                    batch_request, timeout=timeout or self.COMMAND_TIMEOUT
                 )
+                if self._is_unknown_command(batch_response):
+                    self._batch_supported = False
+                    logger.debug(
+                        "GPU server lacks get_result_batch | using two queries"
+                    )
+                elif batch_response is None:
+                    # Timeout or broken socket: retrying as two more queries
+                    # would only wait out two more command timeouts
+                    logger.error("❌ GPU batch query fail | error=No response")
+                    return {"success": False, "error": "No response"}
+                else:
+                    self._batch_supported = True
+                    coord_response = row_response = batch_response
+
+            # Get coordinate values using get_result_coords API
+            if coord_queries:
+                if coord_response is None:
+                    coord_request = {
+                        "command": "get_result_coords",
+                        "gpu_uuid": gpu_uuid,
+                        "queries": coord_queries,
+                    }
+
+                    coord_response = self._send_command(
+                        coord_request, timeout=timeout or self.COMMAND_TIMEOUT
+                    )
 
                 if not coord_response or not coord_response.get("success"):
                     error_msg = (
@@ -423,15 +558,18 @@ class GPUServerClient:
             # Get row data using get_result_rows API
             matrix_size = None
             if row_queries:
-                row_request = {
-                    "command": "get_result_rows",
-                    "gpu_uuid": gpu_uuid,
-                    "row_indices": row_queries,
-                }
+                if row_response is None:
+                    row_request = {
+                        "command": "get_result_rows",
+                        "gpu_uuid": gpu_uuid,
+                        "row_indices": row_queries,
+                    }
+                    if self._row_format:
+                        row_request["format"] = self._row_format
 
-                row_response = self._send_command(
-                    row_request, timeout=timeout or self.COMMAND_TIMEOUT
-                )
+                    row_response = self._send_command(
+                        row_request, timeout=timeout or self.COMMAND_TIMEOUT
+                    )
 
                 if not row_response or not row_response.get("success"):
                     error_msg = (
@@ -443,22 +581,50 @@ class GPUServerClient:
                     return {"success": False, "error": f"Row query failed: {error_msg}"}
 
                 matrix_size = row_response.get("matrix_size")
-                row_data = row_response.get("rows", {})
-
-                # Append row data in order
-                for row_idx in row_queries:
-                    if str(row_idx) in row_data:
-                        all_values.extend(row_data[str(row_idx)])
-                    else:
-                        logger.error(f"Missing row data for row {row_idx}")
-                        return {
-                            "success": False,
-                            "error": f"Missing row data for row {row_idx}",
-                        }
+                payload = row_response.get("payload")
+
+                if payload is not None:
+                    try:
+                        # Binary reply: float32 little-endian rows in request order
+                        expected = len(row_queries) * (matrix_size or 0) * 4
+                        if not matrix_size or len(payload) != expected:
+                            logger.error(
+                                f"❌ GPU row payload size mismatch | got={len(payload)} expected={expected}"
+                            )
+                            return {
+                                "success": False,
+                                "error": "Row query failed: payload size mismatch",
+                            }
+                        row_values = array("f")
+                        row_values.frombytes(payload)
+                        if sys.byteorder == "big":
+                            row_values.byteswap()
+                        # tolist() builds the floats in C; extend then copies pointers
+                        all_values.extend(row_values.tolist())
+                    finally:
+                        # Release shared-memory mappings promptly
+                        if isinstance(payload, mmap.mmap):
+                            payload.close()
+                else:
+                    row_data = row_response.get("rows", {})
+
+                    # Append row data in order
+                    for row_idx in row_queries:
+                        row_values = row_data.get(str(row_idx))
+                        if row_values is not None:
+                            all_values.extend(row_values)
+                        else:
+                            logger.error(f"Missing row data for row {row_idx}")
+                            return {
+                                "success": False,
+                                "error": f"Missing row data for row {row_idx}",
+                            }
 
             logger.debug(
-                f"Retrieved {len(all_values)} values from GPU: "
-                f"{len(coord_queries)} coords + {len(row_queries)} rows"
+                "Retrieved {} values from GPU: {} coords + {} rows",
+                len(all_values),
+                len(coord_queries),
+                len(row_queries),
             )
 
             # Return unified response format
@@ -478,6 +644,13 @@ class GPUServerClient:
             self._handle_communication_error()
             return {"success": False, "error": f"Communication error: {e}"}
 
+    @staticmethod
+    def _is_unknown_command(response: Optional[Dict[str, Any]]) -> bool:
+        """Whether the server rejected a command it does not implement"""
+        if not response or response.get("success"):
+            return False
+        return "unknown command" in str(response.get("error", "")).lower()
+
     def clear_result_cache(
         self, gpu_uuid: Optional[str] = None, timeout: Optional[int] = None
     ) -> Dict[str, Any]:
@@ -491,9 +664,9 @@ class GPUServerClient:
         Returns:
             Response indicating success/failure of cache clearing
         """
-        if not self.is_available():
-            if not self.connect():
-                return {"success": False, "error": "GPU server not available"}
+        error = self._ensure_connected()
+        if error:
+            return {"success": False, "error": error}
 
         try:
             # Match GPU server clear_result_cache API format
@@ -501,7 +674,7 @@ class GPUServerClient:
             if gpu_uuid:
                 request["gpu_uuid"] = gpu_uuid
 
-            logger.debug(f"Clearing result cache for GPU: {gpu_uuid or 'all GPUs'}")
+            logger.debug("Clearing result cache for GPU: {}", gpu_uuid or "all GPUs")
 
             response = self._send_command(
                 request, timeout=timeout or self.COMMAND_TIMEOUT
@@ -510,7 +683,9 @@ class GPUServerClient:
             if response and response.get("success"):
                 cleared_count = response.get("cleared_count", 0)
                 target_gpu = gpu_uuid or "all GPUs"
-                logger.debug(f"Cache cleared for {target_gpu}: {cleared_count} entries")
+                logger.debug(
+                    "Cache cleared for {}: {} entries", target_gpu, cleared_count
+                )
                 return response
             else:
                 error_msg = (
@@ -534,16 +709,23 @@ class GPUServerClient:
             True if server is responsive, False otherwise
         """
         try:
-            # Match CUDA program ping format
-            request = {"command": "ping"}
+            if self._fast_ping:
+                is_responsive = self._ping_sentinel(timeout=5)
+            else:
+                # Match CUDA program ping format
+                request = {"command": "ping"}
+
+                response = self._send_command(request, timeout=5)
 
-            response = self._send_command(request, timeout=5)
+                # Check for "pong" response as per CUDA program spec
+                is_responsive = response and response.get("pong") is True
 
-            # Check for "pong" response as per CUDA program spec
-            is_responsive = response and response.get("pong") is True
+                # Servers speaking protocol v2 accept the 1-byte ping on seqpacket
+                if is_responsive and self.seqpacket:
+                    self._fast_ping = response.get("protocol_version", 1) >= 2
 
             if is_responsive:
-                self.last_ping_time = time.time()
+                self.last_ping_time = time.monotonic()
                 self.is_connected = True
             else:
                 self.is_connected = False
@@ -554,6 +736,36 @@ class GPUServerClient:
             self.is_connected = False
             return False
 
+    def _ping_sentinel(self, timeout: float) -> bool:
+        """Ping with a 1-byte sentinel message; expects a 1-byte pong"""
+        try:
+            with self._sock_slots:
+                sock, generation = self._checkout_sock()
+                for _ in range(2):
+                    reused = sock is not None
+                    if sock is None:
+                        sock = self._open_sock(timeout)
+                    else:
+                        sock.settimeout(timeout)
+                    try:
+                        sock.sendall(_PING_SENTINEL)
+                        reply = sock.recv(1)
+                    except BaseException:
+                        self._close_quietly(sock)
+                        raise
+                    if reply == _PONG_SENTINEL:
+                        self._checkin_sock(sock, generation)
+                        self.last_ping_time = time.monotonic()
+                        return True
+                    self._close_quietly(sock)
+                    sock = None
+                    # Retry once only if a pooled socket had gone stale
+                    if reply or not reused:
+                        break
+        except OSError as e:
+            logger.debug(f"GPU sentinel ping failed | error={e}")
+        return False
+
     def _send_command(
         self, request: Dict[str, Any], timeout: int = None
     ) -> Optional[Dict[str, Any]]:
@@ -571,79 +783,280 @@ class GPUServerClient:
             timeout = self.COMMAND_TIMEOUT
 
         try:
-            # Create socket connection
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
+            # Serialize request to JSON
+            request_bytes = json_codec.dumps_bytes(request)
 
-            try:
-                # Connect to GPU server
-                sock.connect(self.socket_path)
-
-                # Serialize request to JSON
-                request_json = json.dumps(request)
-                request_bytes = request_json.encode("utf-8")
+            with self._sock_slots:
+                sock, generation = self._checkout_sock()
+                try:
+                    response, sock = self._exchange(sock, request_bytes, timeout)
+                except BaseException:
+                    # Force a real ping on the next availability check
+                    self.last_ping_time = 0.0
+                    raise
+                self._checkin_sock(sock, generation)
+                self.last_ping_time = time.monotonic()
+                return response
 
-                # Protocol requires length prefix
-                length = len(request_bytes)
-                sock.sendall(struct.pack("<I", length))
+        except socket.timeout:
+            logger.warning(f"GPU socket timeout | timeout={timeout}s")
+            return None
+        except (socket.error, json.JSONDecodeError, Exception) as e:
+            logger.error(f"❌ GPU communication error | error={e}")
+            return None
 
-                # Send message data
-                sock.sendall(request_bytes)
+    def _exchange(
+        self, sock: Optional[socket.socket], request_bytes: bytes, timeout: float
+    ) -> Tuple[Dict[str, Any], socket.socket]:
+        """
+        Send one request and read the reply
 
-                # Protocol requires reading length prefix
-                length_data = sock.recv(4)
-                if len(length_data) != 4:
-                    raise GPUServerError("Failed to read response length")
+        Args:
+            sock: Idle pooled socket, or None to open a new connection
+            request_bytes: Serialized request
+            timeout: Socket timeout in seconds
 
-                response_length = struct.unpack("<I", length_data)[0]
+        Returns:
+            Tuple of (response, socket to return to the pool)
 
-                # Sanity check
-                if response_length > 16 * 1024 * 1024:
-                    raise GPUServerError("Response too large")
+        A pooled socket that the server has closed is replaced once before
+        the error is propagated. On failure the socket is closed, since the
+        stream framing is unknown afterwards.
+        """
+        # Descriptors passed with the reply (memfd row payloads)
+        fds: Optional[List[int]] = [] if self.memfd_rows else None
+        try:
+            return self._exchange_once(sock, request_bytes, timeout, fds)
+        finally:
+            # A mapping holds its own reference; received descriptors can go
+            for fd in fds or ():
+                os.close(fd)
 
-                # Read response data
-                response_data = b""
-                while len(response_data) < response_length:
-                    chunk = sock.recv(response_length - len(response_data))
-                    if not chunk:
-                        break
-                    response_data += chunk
+    def _exchange_once(
+        self,
+        sock: Optional[socket.socket],
+        request_bytes: bytes,
+        timeout: float,
+        fds: Optional[List[int]],
+    ) -> Tuple[Dict[str, Any], socket.socket]:
+        """Request/reply round-trip for _exchange, collecting passed fds"""
+        while True:
+            reused = sock is not None
+            if sock is None:
+                sock = self._open_sock(timeout)
+            else:
+                sock.settimeout(timeout)
+            try:
+                if self.seqpacket:
+                    # Kernel keeps message boundaries; no length prefix needed
+                    sock.sendall(request_bytes)
+                else:
+                    # Length prefix and body in one write (commands are small)
+                    sock.sendall(_HDR_STRUCT.pack(len(request_bytes)) + request_bytes)
+
+                response_data = self._read_message(sock, fds)
+            except (BrokenPipeError, ConnectionResetError):
+                self._close_quietly(sock)
+                if not reused:
+                    raise
+                sock = None
+                continue
+            except BaseException:
+                self._close_quietly(sock)
+                raise
+
+            if not response_data:
+                self._close_quietly(sock)
+                if reused:
+                    # Server dropped the idle connection before reading the request
+                    sock = None
+                    continue
+                raise GPUServerError("Failed to read response length")
+            break
 
-                if len(response_data) != response_length:
-                    raise GPUServerError("Incomplete response received")
+        try:
+            # Parse JSON response straight from bytes
+            response = json_codec.loads(response_data)
+
+            if isinstance(response, dict):
+                reply_format = response.get("format")
+                if reply_format == "binary":
+                    # Binary replies carry their raw payload in a second message
+                    response["payload"] = self._read_message(sock)
+                elif reply_format == "memfd":
+                    response["payload"] = self._map_memfd(fds, response.get("size"))
+        except BaseException:
+            self._close_quietly(sock)
+            raise
+
+        return response, sock
+
+    def _read_message(
+        self, sock: socket.socket, fds: Optional[List[int]] = None
+    ) -> bytes:
+        """
+        Read one reply message; empty if the server closed the connection
 
-                # Parse JSON response
-                response_json = response_data.decode("utf-8")
-                response = json.loads(response_json)
+        Args:
+            sock: Connected server socket
+            fds: If given, descriptors passed via SCM_RIGHTS are appended here
+        """
+        anc_size = _FD_ANC_SIZE if fds is not None else 0
+        if not self.seqpacket:
+            if anc_size:
+                length_data, ancdata, flags, _ = sock.recvmsg(4, anc_size)
+                self._collect_fds(ancdata, flags, fds)
+            else:
+                length_data = sock.recv(4)
+            if not length_data:
+                return b""
+            return self._read_frame_body(sock, length_data)
+
+        # Peek with MSG_TRUNC for the real message length, then read it into a
+        # buffer of exactly that size (no per-thread worst-case buffer)
+        message_size = sock.recv_into(
+            bytearray(1), 1, socket.MSG_PEEK | socket.MSG_TRUNC
+        )
+        if not message_size:
+            return b""
+        if message_size > self.MAX_RESPONSE_SIZE:
+            raise GPUServerError("Response too large")
+        buf = bytearray(message_size)
+        nbytes, ancdata, flags, _ = sock.recvmsg_into([buf], anc_size)
+        if anc_size:
+            self._collect_fds(ancdata, flags, fds)
+        if flags & socket.MSG_TRUNC or nbytes != message_size:
+            raise GPUServerError("Response size changed while reading")
+        return buf
+
+    @staticmethod
+    def _collect_fds(
+        ancdata: List[Tuple[int, int, bytes]], flags: int, fds: List[int]
+    ) -> None:
+        """Append SCM_RIGHTS descriptors from ancillary data to fds"""
+        for level, msg_type, data in ancdata:
+            if level == socket.SOL_SOCKET and msg_type == socket.SCM_RIGHTS:
+                received = array("i")
+                received.frombytes(data[: len(data) - len(data) % received.itemsize])
+                fds.extend(received)
+        if flags & socket.MSG_CTRUNC:
+            raise GPUServerError("Ancillary data truncated")
+
+    @staticmethod
+    def _map_memfd(fds: List[int], size: Optional[int]) -> mmap.mmap:
+        """Map the shared-memory payload passed with a memfd reply read-only"""
+        if len(fds) != 1 or not isinstance(size, int) or size <= 0:
+            raise GPUServerError("Invalid memfd reply")
+        if size > os.fstat(fds[0]).st_size:
+            raise GPUServerError("memfd smaller than advertised size")
+        return mmap.mmap(fds[0], size, prot=mmap.PROT_READ)
+
+    @staticmethod
+    def _read_frame_body(sock: socket.socket, length_data: bytes) -> bytes:
+        """Read one frame body given its 4-byte length prefix"""
+        if len(length_data) != 4:
+            raise GPUServerError("Failed to read response length")
+
+        response_length = _HDR_STRUCT.unpack(length_data)[0]
+
+        # Sanity check
+        if response_length > GPUServerClient.MAX_RESPONSE_SIZE:
+            raise GPUServerError("Response too large")
+
+        # Read response data in place; avoids re-copying on every chunk
+        response_data = bytearray(response_length)
+        view = memoryview(response_data)
+        received = 0
+        while received < response_length:
+            nbytes = sock.recv_into(view[received:])
+            if not nbytes:
+                break
+            received += nbytes
 
-                return response
+        if received != response_length:
+            raise GPUServerError("Incomplete response received")
 
-            finally:
-                sock.close()
+        return response_data
 
-        except socket.timeout:
-            logger.warning(f"GPU socket timeout | timeout={timeout}s")
-            return None
-        except (socket.error, json.JSONDecodeError, Exception) as e:
-            logger.error(f"❌ GPU communication error | error={e}")
-            return None
+    def _open_sock(self, timeout: float) -> socket.socket:
+        """Open a new connection to the GPU server"""
+        sock_type = socket.SOCK_SEQPACKET if self.seqpacket else socket.SOCK_STREAM
+        sock = socket.socket(socket.AF_UNIX, sock_type)
+        try:
+            self._tune_sock(sock)
+            sock.settimeout(timeout)
+            sock.connect(self._socket_address)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _checkout_sock(self) -> Tuple[Optional[socket.socket], int]:
+        """Take an idle pooled socket (None if empty) and the pool generation"""
+        with self._sock_lock:
+            sock = self._idle_socks.pop() if self._idle_socks else None
+            return sock, self._pool_generation
+
+    def _checkin_sock(self, sock: socket.socket, generation: int) -> None:
+        """Return a socket to the pool unless the pool was closed meanwhile"""
+        with self._sock_lock:
+            if generation == self._pool_generation:
+                self._idle_socks.append(sock)
+                return
+        self._close_quietly(sock)
+
+    def _tune_sock(self, sock: socket.socket) -> None:
+        """Apply configured send/receive buffer sizes (kernel caps apply)"""
+        if not self.uds_bufsize:
+            return
+        for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, option, self.uds_bufsize)
+            except OSError as e:
+                logger.debug(f"GPU socket buffer not applied | error={e}")
+
+    def _close_pool(self) -> None:
+        """Close idle pooled sockets; in-flight ones are closed on return"""
+        with self._sock_lock:
+            self._pool_generation += 1
+            idle, self._idle_socks = self._idle_socks, []
+            # The next server may be a different build; re-probe ping support
+            self._fast_ping = None
+        for sock in idle:
+            self._close_quietly(sock)
+
+    @staticmethod
+    def _close_quietly(sock: socket.socket) -> None:
+        """Close a socket, ignoring errors"""
+        try:
+            sock.close()
+        except OSError:
+            pass
 
     def _is_process_alive(self) -> bool:
         """Check if GPU server process is alive"""
         if not self.gpu_process:
             return False
 
+        # Back-to-back health checks reuse a recent positive result
+        now = time.monotonic()
+        if now - self._alive_checked_at < self.ALIVE_CHECK_TTL:
+            return True
+
         try:
             # Check if process is still running
-            return self.gpu_process.poll() is None
+            alive = self.gpu_process.poll() is None
         except Exception:
             return False
 
+        self._alive_checked_at = now if alive else 0.0
+        return alive
+
     def _is_server_responsive(self) -> bool:
         """Check if GPU server is responsive via socket connection"""
         try:
-            # Check if socket exists
-            if not os.path.exists(self.socket_path):
+            # Check if socket exists (abstract sockets have no filesystem entry)
+            if not self.abstract_socket and not os.path.exists(self.socket_path):
                 return False
 
             # Try a quick ping
@@ -675,6 +1088,7 @@ class GPUServerClient:
 
             finally:
                 self.gpu_process = None
+                self._alive_checked_at = 0.0
 
     def _refresh_gpu_info(self) -> None:
         """Refresh cached GPU information"""
@@ -683,15 +1097,24 @@ class GPUServerClient:
             if info:
                 self.gpu_info = info
                 self.gpu_uuids = info.get("gpu_uuids", [])
-                logger.debug(f"GPU info refreshed | count={len(self.gpu_uuids)}")
+                logger.debug("GPU info refreshed | count={}", len(self.gpu_uuids))
         except Exception as e:
             logger.warning(f"⚠️ GPU info refresh error | error={e}")
 
+    def _warm_up(self) -> None:
+        """Ping once more on the warmed connection to record steady-state latency"""
+        start = time.perf_counter()
+        if self.ping():
+            self.steady_state_ping_us = (time.perf_counter() - start) * 1e6
+            logger.debug("GPU warm ping | us={:.0f}", self.steady_state_ping_us)
+
     def _handle_communication_error(self) -> None:
         """Handle communication error with server"""
         self.is_connected = False
+        self._close_pool()
         logger.debug(
-            f"⚠️ GPU comm error | retry_next auto_start={'enabled' if self.auto_start else 'disabled'}"
+            "⚠️ GPU comm error | retry_next auto_start={}",
+            "enabled" if self.auto_start else "disabled",
         )
 
     def get_gpu_uuids(self) -> List[str]:
@@ -6,12 +6,24 @@ Handle WebSocket communication with miner
 import asyncio
 import json
 import time
-from typing import Any, Callable, Dict, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set
 
 import websockets
 from loguru import logger
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+from neurons.shared.utils import json_codec
+
+# Messages buffered per awaited type before the oldest is dropped
+PENDING_QUEUE_SIZE = 8
+
+# Receive-side limits: frames buffered by websockets, max frame size, and
+# handlers running at once before the read loop stops draining the socket
+RECV_MAX_QUEUE = 8
+RECV_MAX_SIZE = 4 * 1024 * 1024
+MAX_CONCURRENT_HANDLERS = 4
+
 
 class WebSocketClient:
     """WebSocket client for miner communication"""
@@ -30,23 +42,33 @@ class WebSocketClient:
         self.miner_url = config.get_non_empty_string("miner_url")
         self.ping_interval = config.get_positive_number("ping_interval", int)
         self.ping_timeout = config.get_positive_number("ping_timeout", int)
+        # A send stalled longer than this is treated as a dead connection
+        self.send_timeout = config.get_optional("send_timeout", 5)
 
         # Connection state
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.is_connected_flag = False
 
-        # Message handling (single waiter per type)
+        # Message handling: one bounded deque per awaited type, created on first
+        # wait, plus a single event the read loop sets after appending to any
         self.message_handlers: Dict[str, Callable] = {}
-        self.pending_responses: Dict[str, asyncio.Event] = {}
-        self.received_messages: Dict[str, Dict[str, Any]] = {}
+        self.pending_responses: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._message_arrived = asyncio.Event()
 
         # Background tasks
         self._message_task: Optional[asyncio.Task] = None
+        self._close_task: Optional[asyncio.Task] = None
+        self._handler_tasks: Set[asyncio.Task] = set()
+        self._handler_slots = asyncio.Semaphore(MAX_CONCURRENT_HANDLERS)
 
         logger.info(f"🌐 WebSocket client initialized | url={self.miner_url}")
 
     async def connect(self):
         """Connect to miner WebSocket server"""
+        # Replies from an earlier connection (e.g. a registration_ack that
+        # arrived after its wait timed out) must not satisfy waits on this one
+        self.pending_responses.clear()
+
         try:
             logger.info(f"🔌 Connecting | url={self.miner_url}")
 
@@ -55,6 +77,10 @@ class WebSocketClient:
                 self.miner_url,
                 ping_interval=self.ping_interval,
                 ping_timeout=self.ping_timeout,
+                # Frames are small JSON; per-message deflate costs more than it saves
+                compression=None,
+                max_queue=RECV_MAX_QUEUE,
+                max_size=RECV_MAX_SIZE,
             )
 
             self.is_connected_flag = True
@@ -81,6 +107,11 @@ class WebSocketClient:
             except asyncio.CancelledError:
                 pass
 
+        for task in list(self._handler_tasks):
+            task.cancel()
+        if self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
@@ -93,12 +124,23 @@ class WebSocketClient:
             raise Exception("Not connected to miner")
 
         try:
-            # Send message
-            message_json = json.dumps(message)
-            await self.websocket.send(message_json)
+            # Send message (bytes go out as a binary frame; the miner parses both)
+            payload = json_codec.dumps_bytes(message)
+            await asyncio.wait_for(
+                self.websocket.send(payload), timeout=self.send_timeout
+            )
 
             logger.debug(f"📤 Sent | type={message.get('type', 'unknown')}")
 
+        except asyncio.TimeoutError:
+            logger.error(
+                f"⏳ Send timeout | type={message.get('type', 'unknown')} "
+                f"timeout={self.send_timeout}s"
+            )
+            self.is_connected_flag = False
+            # Close in the background; the close handshake can stall as well
+            self._close_task = asyncio.create_task(self.websocket.close())
+            raise
         except Exception as e:
             logger.error(f"Error sending message: {e}")
             self.is_connected_flag = False
@@ -108,19 +150,25 @@ class WebSocketClient:
         self, message_type: str, timeout: float = 30
     ) -> Optional[Dict[str, Any]]:
         """Wait for a specific message type (single waiter per type)"""
-        # Replace any previous waiter for this type to avoid leaks
-        event = asyncio.Event()
-        self.pending_responses[message_type] = event
-
-        try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-            return self.received_messages.get(message_type)
-        except asyncio.TimeoutError:
-            logger.warning(f"⏳ Wait timeout | type={message_type}")
-            return None
-        finally:
-            self.pending_responses.pop(message_type, None)
-            self.received_messages.pop(message_type, None)
+        pending = self.pending_responses.get(message_type)
+        if pending is None:
+            pending = deque(maxlen=PENDING_QUEUE_SIZE)
+            self.pending_responses[message_type] = pending
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not pending:
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                self._message_arrived.clear()
+                await asyncio.wait_for(self._message_arrived.wait(), remaining)
+            except asyncio.TimeoutError:
+                # Keep the deque so a late reply is picked up by the next wait
+                logger.warning(f"⏳ Wait timeout | type={message_type}")
+                return None
+        return pending.popleft()
 
     def set_message_handler(self, message_type: str, handler: Callable):
         """Set handler for specific message type"""
@@ -137,8 +185,9 @@ class WebSocketClient:
         try:
             async for message in self.websocket:
                 try:
-                    # Parse message
-                    data = json.loads(message)
+                    # Parse message (the miner sends binary frames, which skip
+                    # UTF-8 validation; text frames are still accepted)
+                    data = json_codec.loads(message)
                     message_type = data.get("type")
 
                     if not message_type:
@@ -147,21 +196,26 @@ class WebSocketClient:
 
                     logger.debug(f"📥 Received | type={message_type}")
 
-                    # Fulfill waiter for this exact message type
-                    event = self.pending_responses.get(message_type)
-                    if event:
-                        self.received_messages[message_type] = data
-                        event.set()
-
-                    # Call registered handler
-                    if message_type in self.message_handlers:
-                        try:
-                            await self.message_handlers[message_type](data)
-                        except Exception as e:
-                            logger.error(
-                                f"❌ Handler error | type={message_type} | error={e}",
-                                exc_info=True,
+                    # Hand over to the waiter of this exact message type
+                    pending = self.pending_responses.get(message_type)
+                    if pending is not None:
+                        if len(pending) == PENDING_QUEUE_SIZE:
+                            logger.warning(
+                                f"⚠️ Waiter queue full | type={message_type}"
                             )
+                        pending.append(data)
+                        self._message_arrived.set()
+
+                    # Run registered handler off the read loop; waiting for a
+                    # free slot pushes back on the miner when handlers stall
+                    handler = self.message_handlers.get(message_type)
+                    if handler is not None:
+                        await self._handler_slots.acquire()
+                        task = asyncio.create_task(
+                            self._run_handler(handler, message_type, data)
+                        )
+                        self._handler_tasks.add(task)
+                        task.add_done_callback(self._on_handler_done)
 
                 except json.JSONDecodeError:
                     logger.error("❌ Invalid JSON received")
@@ -182,6 +236,23 @@ class WebSocketClient:
             logger.error(f"❌ Message loop error | error={e}", exc_info=True)
             self.is_connected_flag = False
 
+    async def _run_handler(
+        self, handler: Callable, message_type: str, data: Dict[str, Any]
+    ):
+        """Run a message handler, logging any error it raises"""
+        try:
+            await handler(data)
+        except Exception as e:
+            logger.error(
+                f"❌ Handler error | type={message_type} | error={e}",
+                exc_info=True,
+            )
+
+    def _on_handler_done(self, task: asyncio.Task):
+        """Release the handler slot (also runs for tasks cancelled before starting)"""
+        self._handler_tasks.discard(task)
+        self._handler_slots.release()
+
     def is_connected(self) -> bool:
         """Check if connected to miner"""
         return self.is_connected_flag and self.websocket is not None
@@ -8,7 +8,14 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from neurons.shared.config.config_manager import ConfigManager
+from neurons.worker.utils.worker_id_generator import WorkerIDGenerator
 
 
 class WorkerConfig(ConfigManager):
@@ -25,6 +32,17 @@ class WorkerConfig(ConfigManager):
         config_data = self._load_config()
         super().__init__(config_data)
 
+        # Derived values computed on first use; the system fingerprint is
+        # process-stable, capabilities are reset by update()
+        self._system_fingerprint: Optional[Dict[str, Any]] = None
+        self._worker_id: Optional[str] = None
+        self._capabilities: Optional[List[str]] = None
+
+    def update(self, updates: Dict[str, Any]) -> None:
+        """Update configuration"""
+        super().update(updates)
+        self._capabilities = None
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         config_path = Path(self.config_file)
@@ -33,8 +51,9 @@ class WorkerConfig(ConfigManager):
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
 
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            # Bytes let the loader detect the encoding itself
+            with open(config_path, "rb") as f:
+                config = yaml.load(f, Loader=SafeLoader)
 
             if not isinstance(config, dict):
                 raise ValueError("Configuration file must contain a YAML dictionary")
@@ -54,9 +73,11 @@ class WorkerConfig(ConfigManager):
         Returns:
             Stable 16-character worker ID string
         """
-        from neurons.worker.utils.worker_id_generator import WorkerIDGenerator
-
-        return WorkerIDGenerator.generate_worker_id()
+        if self._worker_id is None:
+            self._worker_id = WorkerIDGenerator.generate_worker_id(
+                self._get_fingerprint_data()
+            )
+        return self._worker_id
 
     def get_worker_name(self) -> Optional[str]:
         """
@@ -86,23 +107,24 @@ class WorkerConfig(ConfigManager):
         Returns:
             List of capability strings (e.g., ['cpu_matrix', 'gpu_matrix'])
         """
-        capabilities = []
+        if self._capabilities is None:
+            # Always supports CPU matrix computation
+            capabilities = ["cpu_matrix"]
 
-        # Always supports CPU matrix computation
-        capabilities.append("cpu_matrix")
-
-        # Check for GPU capability
-        try:
-            if self.get("gpu.enable"):
+            # GPU configuration is optional
+            if self.get_optional("gpu.enable", False):
                 capabilities.append("gpu_matrix")
-        except KeyError:
-            # GPU configuration is optional - skip if not present
-            pass
 
-        return capabilities
+            self._capabilities = capabilities
+
+        return list(self._capabilities)
 
     def get_system_fingerprint(self) -> str:
         """Generate a system fingerprint for worker identification"""
-        from neurons.worker.utils.worker_id_generator import WorkerIDGenerator
+        return WorkerIDGenerator._serialize_fingerprint(self._get_fingerprint_data())
 
-        return WorkerIDGenerator.get_system_fingerprint()
+    def _get_fingerprint_data(self) -> Dict[str, Any]:
+        """Collect the system fingerprint once per process"""
+        if self._system_fingerprint is None:
+            self._system_fingerprint = WorkerIDGenerator._get_system_fingerprint()
+        return self._system_fingerprint
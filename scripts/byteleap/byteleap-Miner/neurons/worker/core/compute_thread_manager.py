@@ -1,23 +1,25 @@
 """
 Compute Thread Manager
-Independent CPU/GPU computation thread pools to avoid blocking the main event loop
+Independent CPU/GPU computation threads to avoid blocking the main event loop
 """
 
 import asyncio
+import queue
 import threading
 import time
-from collections import defaultdict
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from loguru import logger
 
 
-class ComputeType(Enum):
-    CPU = "cpu"
-    GPU = "gpu"
+class ComputeType:
+    """Compute types as plain ints (cheap comparisons on the submit path)"""
+
+    CPU = 0
+    GPU = 1
+    NAMES = ("cpu", "gpu")
 
 
 @dataclass
@@ -25,9 +27,9 @@ class ComputeTask:
     """Compute task information"""
 
     task_id: str
-    compute_type: ComputeType
+    compute_type: int  # ComputeType.CPU or ComputeType.GPU
     task_data: Dict[str, Any]
-    plugin: Any
+    execute: Callable[[Dict[str, Any]], Dict[str, Any]]  # Bound plugin.execute_task
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     future: Optional[Future] = None
@@ -47,9 +49,12 @@ class ComputeThreadManager:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
 
-        # Prevent resource conflicts
-        self.cpu_executor: Optional[ThreadPoolExecutor] = None
-        self.gpu_executor: Optional[ThreadPoolExecutor] = None
+        # One persistent thread per compute type, fed through its own queue
+        self.cpu_queue: Optional[queue.SimpleQueue] = None
+        self.gpu_queue: Optional[queue.SimpleQueue] = None
+
+        # plugin.execute_task bound once per compute type by register_plugin
+        self._task_runners: List[Optional[Callable]] = [None, None]
 
         self.active_tasks: Dict[str, ComputeTask] = {}
         self.cpu_busy = False
@@ -58,48 +63,42 @@ class ComputeThreadManager:
 
         self.is_running = False
 
-        # Performance tracking
-        self.task_metrics = defaultdict(
-            lambda: {"total": 0, "success": 0, "failed": 0, "total_time": 0.0}
-        )
+        # Performance tracking: [total, success, failed, total_time] indexed by
+        # ComputeType, written only from the event loop and read without task_lock
+        self._task_stats = ([0, 0, 0, 0.0], [0, 0, 0, 0.0])
         self.start_time = time.time()
 
         logger.info("🧵 ComputeThreadManager initialized | single-thread CPU/GPU")
 
     def start(self) -> None:
-        """Start compute thread pools"""
+        """Start compute threads"""
         if self.is_running:
             logger.warning("ComputeThreadManager already running")
             return
 
         logger.info("🚀 ComputeThreadManager start")
-        self.cpu_executor = ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="CPU-Compute"
-        )
-
-        self.gpu_executor = ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="GPU-Compute"
-        )
+        self.cpu_queue = self._start_compute_thread("CPU-Compute")
+        self.gpu_queue = self._start_compute_thread("GPU-Compute")
 
         self.is_running = True
         logger.success("✅ ComputeThreadManager started")
 
     def stop(self) -> None:
-        """Stop compute thread pools immediately"""
+        """Stop compute threads immediately"""
         if not self.is_running:
             return
 
         logger.info("⏹️ ComputeThreadManager stop")
         self.is_running = False
 
-        # Prevent blocking on shutdown
-        if self.cpu_executor:
-            self.cpu_executor.shutdown(wait=False)
-            self.cpu_executor = None
+        # Prevent blocking on shutdown: threads exit once their current task ends
+        if self.cpu_queue:
+            self.cpu_queue.put(None)
+            self.cpu_queue = None
 
-        if self.gpu_executor:
-            self.gpu_executor.shutdown(wait=False)
-            self.gpu_executor = None
+        if self.gpu_queue:
+            self.gpu_queue.put(None)
+            self.gpu_queue = None
 
         with self.task_lock:
             self.active_tasks.clear()
@@ -108,21 +107,35 @@ class ComputeThreadManager:
 
         logger.success("✅ ComputeThreadManager stopped")
 
+    def register_plugin(self, compute_type: int, plugin: Any) -> None:
+        """
+        Register the execution plugin for a compute type
+
+        Args:
+            compute_type: Computation type (CPU/GPU)
+            plugin: Plugin providing execute_task(task_data)
+
+        Raises:
+            ValueError: If plugin has no execute_task method
+        """
+        execute = getattr(plugin, "execute_task", None)
+        if not callable(execute):
+            raise ValueError(f"Plugin {plugin} does not have execute_task method")
+        self._task_runners[compute_type] = execute
+
     async def submit_compute_task(
         self,
         task_id: str,
-        compute_type: ComputeType,
+        compute_type: int,
         task_data: Dict[str, Any],
-        plugin: Any,
     ) -> Dict[str, Any]:
         """
-        Submit compute task to independent thread pool
+        Submit compute task to its compute thread
 
         Args:
             task_id: Task identifier
             compute_type: Computation type (CPU/GPU)
             task_data: Task data
-            plugin: Execution plugin
 
         Returns:
             Compute result for continued business logic processing
@@ -130,6 +143,12 @@ class ComputeThreadManager:
         if not self.is_running:
             raise RuntimeError("ComputeThreadManager not running")
 
+        execute = self._task_runners[compute_type]
+        if execute is None:
+            raise RuntimeError(
+                f"No plugin registered for {ComputeType.NAMES[compute_type]}"
+            )
+
         # Prevent resource conflicts
         with self.task_lock:
             if task_id in self.active_tasks:
@@ -147,7 +166,7 @@ class ComputeThreadManager:
                 task_id=task_id,
                 compute_type=compute_type,
                 task_data=task_data,
-                plugin=plugin,
+                execute=execute,
             )
             self.active_tasks[task_id] = compute_task
 
@@ -156,37 +175,41 @@ class ComputeThreadManager:
             else:
                 self.gpu_busy = True
 
-        executor = (
-            self.cpu_executor if compute_type == ComputeType.CPU else self.gpu_executor
+        task_queue = (
+            self.cpu_queue if compute_type == ComputeType.CPU else self.gpu_queue
         )
-        if not executor:
-            raise RuntimeError(f"No executor available for {compute_type.value}")
 
+        type_name = ComputeType.NAMES[compute_type]
+        succeeded: Optional[bool] = None
+        execution_time = 0.0
         try:
-            logger.info(f"📥 Submit compute | type={compute_type.value} id={task_id}")
+            if not task_queue:
+                raise RuntimeError(f"No compute thread available for {type_name}")
+
+            logger.info(f"📥 Submit compute | type={type_name} id={task_id}")
 
             compute_task.started_at = time.time()
-            future = executor.submit(self._execute_in_thread, compute_task)
+            future = Future()
             compute_task.future = future
+            task_queue.put((compute_task, future))
 
             result = await asyncio.wrap_future(future)
 
+            succeeded = True
             execution_time = time.time() - compute_task.started_at
             logger.success(
                 f"✅ Compute complete | id={task_id} duration={execution_time:.2f}s"
             )
 
-            self._record_task_metric(compute_type.value, True, execution_time)
-
             return result
 
         except Exception as e:
             logger.error(f"❌ Compute error | id={task_id} error={e}", exc_info=True)
 
+            succeeded = False
             execution_time = (
                 time.time() - compute_task.started_at if compute_task.started_at else 0
             )
-            self._record_task_metric(compute_type.value, False, execution_time)
             raise
         finally:
             with self.task_lock:
@@ -195,6 +218,32 @@ class ComputeThreadManager:
                     self.cpu_busy = False
                 else:
                     self.gpu_busy = False
+            if succeeded is not None:
+                self._record_task_metric(compute_type, succeeded, execution_time)
+
+    def _start_compute_thread(self, name: str) -> queue.SimpleQueue:
+        """Start a daemon compute thread and return the queue that feeds it"""
+        task_queue = queue.SimpleQueue()
+        threading.Thread(
+            target=self._compute_loop, args=(task_queue,), name=name, daemon=True
+        ).start()
+        return task_queue
+
+    def _compute_loop(self, task_queue: queue.SimpleQueue) -> None:
+        """Run queued compute tasks one at a time until a None sentinel arrives"""
+        while True:
+            item = task_queue.get()
+            if item is None:
+                return
+
+            compute_task, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(self._execute_in_thread(compute_task))
+            except BaseException as e:
+                future.set_exception(e)
 
     def _execute_in_thread(self, compute_task: ComputeTask) -> Dict[str, Any]:
         """
@@ -211,17 +260,11 @@ class ComputeThreadManager:
         """
         thread_name = threading.current_thread().name
         logger.debug(
-            f"🧵 Thread exec | type={compute_task.compute_type.value} id={compute_task.task_id} thread={thread_name}"
+            f"🧵 Thread exec | type={ComputeType.NAMES[compute_task.compute_type]} id={compute_task.task_id} thread={thread_name}"
         )
 
         try:
-            if hasattr(compute_task.plugin, "execute_task"):
-                result = compute_task.plugin.execute_task(compute_task.task_data)
-            else:
-                raise RuntimeError(
-                    f"Plugin {compute_task.plugin} does not have execute_task method"
-                )
-
+            result = compute_task.execute(compute_task.task_data)
             if result is None:
                 raise RuntimeError(f"Plugin returned None result")
 
@@ -260,41 +303,41 @@ class ComputeThreadManager:
             return not self.cpu_busy
 
     def _record_task_metric(
-        self, task_type: str, success: bool, execution_time: float
+        self, compute_type: int, success: bool, execution_time: float
     ) -> None:
-        """Record task execution metrics"""
-        with self.task_lock:
-            metric = self.task_metrics[task_type]
-            metric["total"] += 1
-            if success:
-                metric["success"] += 1
-            else:
-                metric["failed"] += 1
-            metric["total_time"] += execution_time
+        """Record task execution metrics (event loop only, no lock needed)"""
+        stats = self._task_stats[compute_type]
+        stats[0] += 1
+        stats[1 if success else 2] += 1
+        stats[3] += execution_time
 
     def get_metrics(self) -> Dict[str, Any]:
-        """Get compute thread manager monitoring metrics"""
+        """
+        Get compute thread manager monitoring metrics
+
+        Task stats are read without task_lock, so a read racing a completion
+        may see that task's total before its success/failed count.
+        """
         with self.task_lock:
-            uptime = time.time() - self.start_time
             metrics = {
-                "uptime_seconds": uptime,
+                "uptime_seconds": time.time() - self.start_time,
                 "active_tasks": len(self.active_tasks),
                 "cpu_busy": self.cpu_busy,
                 "gpu_busy": self.gpu_busy,
                 "task_stats": {},
             }
 
-            # Calculate performance metrics
-            for task_type, stats in self.task_metrics.items():
-                total = stats["total"]
-                if total > 0:
-                    metrics["task_stats"][task_type] = {
-                        "total_tasks": total,
-                        "successful_tasks": stats["success"],
-                        "failed_tasks": stats["failed"],
-                        "success_rate": stats["success"] / total,
-                        "average_execution_time": stats["total_time"] / total,
-                        "total_execution_time": stats["total_time"],
-                    }
-
-            return metrics
+        # Calculate performance metrics
+        for compute_type, stats in enumerate(self._task_stats):
+            total, success, failed, total_time = stats
+            if total > 0:
+                metrics["task_stats"][ComputeType.NAMES[compute_type]] = {
+                    "total_tasks": total,
+                    "successful_tasks": success,
+                    "failed_tasks": failed,
+                    "success_rate": success / total,
+                    "average_execution_time": total_time / total,
+                    "total_execution_time": total_time,
+                }
+
+        return metrics
@@ -3,7 +3,9 @@ Worker Result Cache Module
 Manages a per-validator, per-UUID cache for challenge computation results.
 """
 
+import hashlib
 import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -11,6 +13,9 @@ from loguru import logger
 from neurons.shared.utils.merkle_tree import MerkleTree
 from neurons.worker.clients.gpu_client import GPUServerClient
 
+# Recently built trees kept for reuse when the same row hashes come back
+TREE_CACHE_SIZE = 16
+
 
 class ResultCache:
     """
@@ -27,6 +32,8 @@ class ResultCache:
         """
         # Structure: {validator_hotkey -> {uuid -> MerkleTree}}
         self._cache: Dict[str, Dict[str, MerkleTree]] = {}
+        # Structure: {digest of row_hashes -> MerkleTree}, least recently used first
+        self._tree_lru: "OrderedDict[bytes, MerkleTree]" = OrderedDict()
         self._gpu_client = GPUServerClient(config) if config else None
         logger.debug("ResultCache initialized")
 
@@ -54,7 +61,7 @@ class ResultCache:
                 continue
 
             try:
-                self._cache[validator_hotkey][uuid] = MerkleTree(row_hashes)
+                self._cache[validator_hotkey][uuid] = self._get_tree(row_hashes)
                 logger.debug(
                     f"🌳 Merkle cached | validator={validator_hotkey} uuid={uuid}"
                 )
@@ -63,6 +70,28 @@ class ResultCache:
                     f"❌ Merkle cache error | validator={validator_hotkey} uuid={uuid} error={e}"
                 )
 
+    def _get_tree(self, row_hashes: List[str]) -> MerkleTree:
+        """
+        Returns the MerkleTree for row_hashes, reusing a recently built one.
+
+        Trees are keyed by a digest of every row hash, so a hit is always the
+        same tree; hashing the rows once is far cheaper than rebuilding.
+        """
+        key = hashlib.blake2b(
+            "\n".join(row_hashes).encode("utf-8"), digest_size=16
+        ).digest()
+
+        tree = self._tree_lru.get(key)
+        if tree is not None:
+            self._tree_lru.move_to_end(key)
+            return tree
+
+        tree = MerkleTree(row_hashes)
+        self._tree_lru[key] = tree
+        if len(self._tree_lru) > TREE_CACHE_SIZE:
+            self._tree_lru.popitem(last=False)
+        return tree
+
     def generate_proof(
         self, validator_hotkey: str, request_item: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -88,19 +117,22 @@ class ResultCache:
             return None
 
         merkle_tree = validator_cache[uuid]
+        # ProofResponse requires row_hashes and merkle_proofs even when empty
         response = {
             "uuid": uuid,
             "row_hashes": [],
             "merkle_proofs": [],
             "coordinate_values": [],
         }
+        if not requested_rows and not requested_coords:
+            return response
 
         try:
             # Generate Merkle proofs for requested rows
             if requested_rows:
                 proofs = []
-                for idx in requested_rows:
-                    proof = merkle_tree.generate_proof(idx)
+                row_hashes = []
+                for proof in merkle_tree.generate_batch_proofs(requested_rows):
                     proofs.append(
                         {
                             "leaf_index": proof.leaf_index,
@@ -109,10 +141,10 @@ class ResultCache:
                             "proof_directions": proof.proof_directions,
                         }
                     )
+                    # The proof already carries the leaf hash; no second lookup
+                    row_hashes.append(proof.leaf_hash)
                 response["merkle_proofs"] = proofs
-                response["row_hashes"] = [
-                    merkle_tree.leaf_hashes[idx] for idx in requested_rows
-                ]
+                response["row_hashes"] = row_hashes
 
             # GPU challenges require specific coordinate values
             if requested_coords:
@@ -127,14 +159,10 @@ class ResultCache:
                     if coord_response and coord_response.get("success"):
                         response["coordinate_values"] = coord_response.get("values", [])
 
-                        # Clear GPU result cache after retrieving Phase 2 data
-                        clear_response = self._gpu_client.clear_result_cache(uuid)
-                        if clear_response and clear_response.get("success"):
-                            logger.debug(f"🧹 GPU result cache cleared | uuid={uuid}")
-                        else:
-                            logger.warning(
-                                f"⚠️ GPU result cache clear failed | uuid={uuid} resp={clear_response}"
-                            )
+                        # Clear GPU result cache after retrieving Phase 2 data.
+                        # Done before responding: the uuid is the GPU device, and
+                        # a late clear would wipe the next challenge's results
+                        self._clear_gpu_cache(uuid)
                     else:
                         logger.error(f"❌ GPU values fetch failed | uuid={uuid}")
 
@@ -145,6 +173,16 @@ class ResultCache:
             )
             return None
 
+    def _clear_gpu_cache(self, uuid: str):
+        """Clears the GPU server's result cache for a UUID"""
+        clear_response = self._gpu_client.clear_result_cache(uuid)
+        if clear_response and clear_response.get("success"):
+            logger.debug(f"🧹 GPU result cache cleared | uuid={uuid}")
+        else:
+            logger.warning(
+                f"⚠️ GPU result cache clear failed | uuid={uuid} resp={clear_response}"
+            )
+
     def clear_cache_for_validator(self, validator_hotkey: str):
         """
         Clears the entire cache for a specific validator after the proof request is handled.
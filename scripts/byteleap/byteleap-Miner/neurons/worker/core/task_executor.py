@@ -5,6 +5,7 @@ Execute various types of compute tasks
 
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Set
 
@@ -52,21 +53,38 @@ class TaskExecutor:
             "gpu_matrix": GPUMatrixComputePlugin(config),
         }
         self.result_cache = ResultCache(config)
+        # Proof items block on GPU server IPC; more threads than pooled server
+        # connections would only queue on the pool
+        self._proof_workers = max(1, int(config.get_optional("gpu.pool_size", 4)))
+        self._proof_executor: Optional[ThreadPoolExecutor] = None
         self.completion_callback: Optional[Callable] = None
         self.is_running = False
         self._cleanup_task: Optional[asyncio.Task] = None
 
         # Compute thread manager
         self.compute_manager = ComputeThreadManager(config.config)
+        self.compute_manager.register_plugin(
+            ComputeType.CPU, self.plugins["cpu_matrix"]
+        )
+        self.compute_manager.register_plugin(
+            ComputeType.GPU, self.plugins["gpu_matrix"]
+        )
 
     async def start(self):
         self.is_running = True
+        if self._proof_executor is None:
+            self._proof_executor = ThreadPoolExecutor(
+                max_workers=self._proof_workers, thread_name_prefix="proof"
+            )
         self.compute_manager.start()
         self._cleanup_task = asyncio.create_task(self._cleanup_tasks())
 
     async def stop(self):
         self.is_running = False
         self.compute_manager.stop()
+        if self._proof_executor is not None:
+            self._proof_executor.shutdown(wait=False)
+            self._proof_executor = None
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
@@ -110,7 +128,8 @@ class TaskExecutor:
 
         try:
             task_info.status = "running"
-            plugin = self.plugins[task_info.task_type]
+            if task_info.task_type not in self.plugins:
+                raise ValueError(f"Unsupported task type: {task_info.task_type}")
 
             # Determine compute type
             compute_type = (
@@ -124,7 +143,6 @@ class TaskExecutor:
                 task_id=task_info.task_id,
                 compute_type=compute_type,
                 task_data=task_info.task_data,
-                plugin=plugin,
             )
 
             # Defensive check for None response from plugin
@@ -203,13 +221,27 @@ class TaskExecutor:
         Returns:
             A list of proof result objects, one for each request item.
         """
-        proofs = []
         if not validator_hotkey or not proof_requests:
             return []
 
-        for request_item in proof_requests:
-            proof = self.result_cache.generate_proof(validator_hotkey, request_item)
-            proofs.append(proof)
+        # Items may block on GPU server IPC; run them concurrently off the loop
+        if self._proof_executor is None:
+            logger.error("❌ Proof generation requested while executor is stopped")
+            return [None] * len(proof_requests)
+        loop = asyncio.get_running_loop()
+        proofs = list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self._proof_executor,
+                        self.result_cache.generate_proof,
+                        validator_hotkey,
+                        request_item,
+                    )
+                    for request_item in proof_requests
+                )
+            )
+        )
 
         # Clear the cache for the validator after all proofs have been generated.
         self.result_cache.clear_cache_for_validator(validator_hotkey)
@@ -13,6 +13,13 @@ from typing import Any, Dict, Optional
 
 from loguru import logger
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from neurons.shared.utils.system_monitor import \
     EnhancedSystemMonitor as SystemMonitor
 from neurons.worker.communication.websocket_client import WebSocketClient
@@ -448,6 +455,10 @@ if __name__ == "__main__":
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{extra[project_name]}:{name}:{line}</cyan> - <level>{message}</level>",
     )
 
+    # Prefer the libuv-based event loop for the WebSocket receive path
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Run main async loop
     try:
         asyncio.run(main())
@@ -4,15 +4,27 @@ ByteLeap Miner Startup Script
 """
 import argparse
 import asyncio
+import atexit
+import gzip
 import logging
 import logging.handlers
 import os
+import shutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import bittensor as bt
-import yaml
+from munch import DefaultMunch
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add project root directory to Python path
 project_root = Path(__file__).parent.parent
@@ -20,6 +32,76 @@ sys.path.insert(0, str(project_root))
 
 from neurons.miner.core.miner import Miner
 from neurons.shared.config.config_manager import ConfigManager
+from neurons.shared.utils import json_codec
+from neurons.shared.utils.yaml_cache import load_yaml_cached
+
+# Keys main() needs before any service starts; validated together at load time
+REQUIRED_CONFIG_SCHEMA = {
+    "netuid": int,
+    "wallet.name": str,
+    "wallet.hotkey": str,
+    "wallet.path": str,
+    "subtensor.network": str,
+}
+
+# Shared by every file handler setup_logging attaches
+_LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Config log level -> bittensor logging switch (anything else: default)
+_BT_LOGGING_ENABLE = {
+    "DEBUG": bt.logging.enable_debug,
+    "INFO": bt.logging.enable_info,
+    "WARNING": bt.logging.enable_warning,
+}
+
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 14
+# Records held in memory before a write; WARNING and above flush immediately
+LOG_BUFFER_RECORDS = 1024
+
+
+class _CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Size-rotating file handler that gzips rotated files in the background"""
+
+    _compress_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_compress: Optional[Future] = None
+
+    def namer(self, default_name: str) -> str:
+        return f"{default_name}.gz"
+
+    def rotator(self, source: str, dest: str) -> None:
+        """Move the active file aside now and compress it off the logging thread"""
+        pending = f"{dest}.pending"
+        os.replace(source, pending)
+        if _CompressingRotatingFileHandler._compress_executor is None:
+            _CompressingRotatingFileHandler._compress_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="log-compress"
+            )
+        self._pending_compress = self._compress_executor.submit(
+            self._gzip_file, pending, dest
+        )
+
+    def doRollover(self) -> None:
+        # Backups are shifted by name, so the previous archive must exist first
+        if self._pending_compress is not None:
+            self._pending_compress.result()
+            self._pending_compress = None
+        super().doRollover()
+
+    @staticmethod
+    def _gzip_file(source: str, dest: str) -> None:
+        try:
+            with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.remove(source)
+        except OSError as e:
+            bt.logging.warning(f"⚠️ Log compression failed | file={source} error={e}")
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -46,14 +128,7 @@ def setup_logging(config: ConfigManager) -> None:
     log_level = config.get("logging.log_level").upper()
 
     # Set bittensor logging level
-    if log_level == "DEBUG":
-        bt.logging.enable_debug()
-    elif log_level == "INFO":
-        bt.logging.enable_info()
-    elif log_level == "WARNING":
-        bt.logging.enable_warning()
-    else:
-        bt.logging.enable_default()
+    _BT_LOGGING_ENABLE.get(log_level, bt.logging.enable_default)()
 
     # Create log directory
     os.makedirs(log_dir, exist_ok=True)
@@ -65,36 +140,40 @@ def setup_logging(config: ConfigManager) -> None:
     # Get the root logger used by bittensor
     root_logger = logging.getLogger()
 
-    # Create rotating file handler - rotates at midnight and keeps 7 days
-    file_handler = logging.handlers.TimedRotatingFileHandler(
+    # Idempotent: keep an already attached handler for this file
+    log_path_str = os.path.abspath(log_filepath)
+    if any(
+        getattr(getattr(handler, "target", handler), "baseFilename", None)
+        == log_path_str
+        for handler in root_logger.handlers
+    ):
+        return
+
+    # Create size-rotating file handler; rotated files are gzipped
+    file_handler = _CompressingRotatingFileHandler(
         filename=log_filepath,
-        when="midnight",
-        interval=1,
-        backupCount=7,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
         encoding="utf-8",
     )
 
-    # Set suffix for rotated files (YYYY-MM-DD format)
-    file_handler.suffix = "%Y-%m-%d"
+    file_handler.setFormatter(_LOG_FORMATTER)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    file_handler.setFormatter(formatter)
+    # Set log level; unknown names fall back to INFO
+    file_level = logging.getLevelName(log_level)
+    file_handler.setLevel(file_level if isinstance(file_level, int) else logging.INFO)
 
-    # Set log level
-    log_level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-    }
-    file_handler.setLevel(log_level_map.get(log_level, logging.INFO))
+    # Buffer writes; flushed on WARNING, when full, and at exit
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_RECORDS,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+    )
+    buffered_handler.setLevel(file_handler.level)
+    atexit.register(buffered_handler.flush)
 
     # Add handler to root logger
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_handler)
     root_logger.setLevel(logging.DEBUG)  # Allow all levels, handlers will filter
 
     # Set websockets logging to WARNING to suppress ping/pong debug messages
@@ -102,78 +181,65 @@ def setup_logging(config: ConfigManager) -> None:
     websockets_logger.setLevel(logging.WARNING)
 
     bt.logging.info(
-        f"🧾 File logging | path={log_filepath} | level={log_level} | rotation=daily"
+        f"🧾 File logging | path={log_filepath} | level={log_level} | rotation={LOG_MAX_BYTES // (1024 * 1024)}MiB"
     )
 
 
 def load_config(config_path: str) -> ConfigManager:
     """Load configuration file and return ConfigManager"""
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
-        return ConfigManager(config_data)
+        if config_path.endswith(".json"):
+            # JSON configs skip the YAML parser entirely
+            config_data = json_codec.loads(Path(config_path).read_bytes())
+        else:
+            config_data = load_yaml_cached(config_path)
+        return ConfigManager(config_data, schema=REQUIRED_CONFIG_SCHEMA)
     except Exception as e:
         bt.logging.error(f"❌ Load config error | error={e}")
         sys.exit(1)
 
 
 def validate_config(config: ConfigManager) -> bool:
-    """Validate configuration validity using fail-fast config methods"""
+    """Validate configuration values beyond the load-time schema check"""
     bt.logging.debug("Config validation start")
-    try:
-        # Test required fields by accessing them (will raise KeyError if missing)
-        bt.logging.debug("Checking netuid")
-        config.get("netuid")
-
-        # Validate network ID
-        netuid = config.get("netuid")
-        if not isinstance(netuid, int) or netuid < 0:
-            bt.logging.error("❌ Config error | netuid must be non-negative int")
-            return False
-
-        # Test worker management configuration
-        try:
-            config.get("worker_management.host")
-            config.get("worker_management.port")
-
-            # Validate worker management port
-            port = config.get("worker_management.port")
-            if not isinstance(port, int) or port < 1024 or port > 65535:
-                bt.logging.error(
-                    f"Error: worker_management.port must be an integer between 1024-65535"
-                )
-                return False
 
-        except KeyError:
-            pass  # Worker management configuration is optional
-
-        bt.logging.info("✅ Config validation done")
-        return True
+    # Presence and type of netuid are enforced by REQUIRED_CONFIG_SCHEMA
+    if config.get("netuid") < 0:
+        bt.logging.error("❌ Config error | netuid must be non-negative int")
+        return False
 
-    except KeyError as e:
-        bt.logging.error(f"❌ Config validation failed | error={e}")
+    # Worker management configuration is optional; validate the port if set
+    port = config.get_optional("worker_management.port")
+    if port is not None and (not isinstance(port, int) or port < 1024 or port > 65535):
+        bt.logging.error(
+            f"Error: worker_management.port must be an integer between 1024-65535"
+        )
         return False
 
+    bt.logging.info("✅ Config validation done")
+    return True
+
 
 def check_miner_registration(
-    wallet: bt.wallet, subtensor: bt.subtensor, metagraph: bt.metagraph
+    wallet: bt.wallet, subtensor: bt.subtensor, netuid: int
 ) -> bool:
     """Check if miner is registered on the subnet"""
     try:
         miner_hotkey = wallet.hotkey.ss58_address
         bt.logging.info(f"🔎 Miner registration | hotkey={miner_hotkey}")
 
-        # Check if hotkey exists in metagraph
-        if hasattr(metagraph, "hotkeys") and miner_hotkey in metagraph.hotkeys:
-            uid = metagraph.hotkeys.index(miner_hotkey)
+        # Single storage lookup instead of pulling the whole metagraph
+        uid = subtensor.get_uid_for_hotkey_on_subnet(miner_hotkey, netuid)
+
+        if uid is not None:
             bt.logging.info(f"✅ Miner registered | uid={uid}")
             return True
         else:
             bt.logging.error(
-                f"❌ Miner not registered | hotkey={miner_hotkey} netuid={metagraph.netuid}"
+                f"❌ Miner not registered | hotkey={miner_hotkey} netuid={netuid}"
             )
             bt.logging.warning(
-                f"⚠️ Register miner: btcli subnet register --netuid {metagraph.netuid} --wallet.name {wallet.name} --wallet.hotkey {wallet.hotkey_str}"
+                f"⚠️ Register miner: btcli subnet register --netuid {netuid} --wallet.name {wallet.name} --wallet.hotkey {wallet.hotkey_str}"
             )
             return False
 
@@ -203,30 +269,31 @@ async def main():
     if not validate_config(config):
         sys.exit(1)
 
+    netuid, wallet_name, wallet_hotkey, wallet_path, network = config.resolve_many(
+        ("netuid", "wallet.name", "wallet.hotkey", "wallet.path", "subtensor.network")
+    )
+
     # Create the bittensor config object from YAML config
     bt_config = bt.config()
 
     # Set configuration values from config
-    bt_config.netuid = config.get("netuid")
+    bt_config.netuid = netuid
 
-    # Create nested config objects without triggering additional config loading
-    from munch import DefaultMunch
-
-    bt_config.wallet = DefaultMunch()
-    bt_config.wallet.name = config.get("wallet.name")
-    bt_config.wallet.hotkey = config.get("wallet.hotkey")
-    bt_config.wallet.path = config.get("wallet.path")
-
-    bt_config.subtensor = DefaultMunch()
-    bt_config.subtensor.network = config.get("subtensor.network")
+    # Create nested config objects without triggering additional config loading.
+    # Bittensor reads unset keys (e.g. subtensor.chain_endpoint) as None and
+    # calls .get() on these, so they must stay DefaultMunch rather than a namespace
+    bt_config.wallet = DefaultMunch(
+        None, name=wallet_name, hotkey=wallet_hotkey, path=wallet_path
+    )
+    bt_config.subtensor = DefaultMunch(None, network=network)
 
     # Setup complete logging configuration (includes bittensor and file logging)
     setup_logging(config)
 
     # Display configuration information
-    bt.logging.info(f"🌐 Netuid | id={config.get('netuid')}")
-    bt.logging.info(f"👛 Wallet | name={config.get('wallet.name')}")
-    bt.logging.info(f"🔑 Hotkey | name={config.get('wallet.hotkey')}")
+    bt.logging.info(f"🌐 Netuid | id={netuid}")
+    bt.logging.info(f"👛 Wallet | name={wallet_name}")
+    bt.logging.info(f"🔑 Hotkey | name={wallet_hotkey}")
 
     try:
         # Create Bittensor objects
@@ -234,15 +301,17 @@ async def main():
         wallet = bt.wallet(config=bt_config)
         bt.logging.debug("Creating subtensor")
         subtensor = bt.subtensor(config=bt_config)
-        bt.logging.debug("Creating metagraph")
-        metagraph = bt.metagraph(netuid=config.get("netuid"), subtensor=subtensor)
 
         # Check miner registration
         bt.logging.debug("Verifying miner registration")
-        if not check_miner_registration(wallet, subtensor, metagraph):
+        if not check_miner_registration(wallet, subtensor, netuid):
             bt.logging.error("Miner registration check failed, exiting...")
             sys.exit(1)
 
+        # Unsynced lite metagraph; ValidatorCache performs the first sync on start
+        bt.logging.debug("Creating metagraph")
+        metagraph = bt.metagraph(netuid=netuid, subtensor=subtensor, sync=False)
+
         # Create and start miner
         bt.logging.debug("Creating miner")
         miner = Miner(config, wallet, subtensor, metagraph)
@@ -259,7 +328,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Unix/Linux event loop policy (default)
+    # Unix/Linux event loop policy: libuv-based loop when available, else default
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     # Run main program
     asyncio.run(main())
@@ -9,6 +9,13 @@ from pathlib import Path
 
 from loguru import logger
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add project root directory to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -76,7 +83,9 @@ if __name__ == "__main__":
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{extra[project_name]}:{name}:{line}</cyan> - <level>{message}</level>",
     )
 
-    # Unix/Linux event loop policy (default)
+    # Unix/Linux event loop policy: libuv-based loop when available, else default
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     # Run main program
     asyncio.run(main())
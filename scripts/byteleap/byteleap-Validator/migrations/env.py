@@ -19,9 +19,12 @@ from neurons.validator.models.database import Base
 # Alembic Config object
 config = context.config
 
-# Interpret logging configuration file
-if config.config_file_name is not None and not os.environ.get(
-    "ALEMBIC_SKIP_LOG_CONFIG"
+# Interpret logging configuration file only for interactive CLI runs; headless
+# invocations (subprocess with captured output, CI) skip building handlers
+if (
+    config.config_file_name is not None
+    and not os.environ.get("ALEMBIC_SKIP_LOG_CONFIG")
+    and sys.stderr.isatty()
 ):
     # Do not disable existing loggers to minimize side effects when used via CLI
     fileConfig(config.config_file_name, disable_existing_loggers=False)
@@ -38,9 +41,15 @@ def _read_yaml_database_url(cfg_path: str) -> str:
     try:
         import yaml
 
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
+        # Parsed directly, never cached: the file holds database credentials
         if os.path.exists(cfg_path):
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            with open(cfg_path, "rb") as f:
+                data = yaml.load(f, Loader=SafeLoader) or {}
                 db = data.get("database") or {}
                 url = db.get("url")
                 return url or ""
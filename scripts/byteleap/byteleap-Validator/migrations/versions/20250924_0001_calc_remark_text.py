@@ -17,10 +17,24 @@ depends_on = None
 
 
 def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # VARCHAR -> TEXT is a catalog-only change on Postgres (no rewrite)
+        op.execute(
+            "ALTER TABLE network_weights ALTER COLUMN calculation_remark TYPE TEXT"
+        )
+        return
+
     with op.batch_alter_table("network_weights", schema=None) as batch_op:
         batch_op.alter_column("calculation_remark", type_=sa.Text())
 
 
 def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE network_weights "
+            "ALTER COLUMN calculation_remark TYPE VARCHAR(256)"
+        )
+        return
+
     with op.batch_alter_table("network_weights", schema=None) as batch_op:
         batch_op.alter_column("calculation_remark", type_=sa.String(length=256))
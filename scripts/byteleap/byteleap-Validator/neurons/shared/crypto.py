@@ -372,9 +372,8 @@ class CryptoManager:
             aesgcm = AESGCM(session_key)
             decrypted_bytes = aesgcm.decrypt(iv, ciphertext_with_tag, aad)
 
-            # Deserialize
-            json_data = decrypted_bytes.decode("utf-8")
-            decrypted_data = json.loads(json_data)
+            # Deserialize straight from bytes; json detects UTF-8 itself
+            decrypted_data = json.loads(decrypted_bytes)
 
             return decrypted_data, session_id, seq
 
@@ -47,7 +47,7 @@ class ProtocolTypes:
 
 
 # Error codes
-class ErrorCodes:
+class ErrorCodes(IntEnum):
     """Standard error codes for the subnet protocol"""
 
     # Success
@@ -91,6 +91,39 @@ class ErrorCodes:
     DB_CONNECTION_ERROR = 5001
 
 
+# Default human-readable message per error code
+ERROR_MESSAGES: Dict[int, str] = {
+    ErrorCodes.SUCCESS: "Success",
+    ErrorCodes.INVALID_REQUEST: "Invalid request",
+    ErrorCodes.INVALID_RESPONSE: "Invalid response",
+    ErrorCodes.TIMEOUT_ERROR: "Request timed out",
+    ErrorCodes.NETWORK_ERROR: "Network error",
+    ErrorCodes.HEARTBEAT_PROCESSING_FAILED: "Heartbeat processing failed",
+    ErrorCodes.TASK_PROCESSING_FAILED: "Task processing failed",
+    ErrorCodes.CHALLENGE_PROCESSING_FAILED: "Challenge processing failed",
+    ErrorCodes.CONFIG_MISSING_KEY: "Missing configuration key",
+    ErrorCodes.CONFIG_INVALID_VALUE: "Invalid configuration value",
+    ErrorCodes.CONFIG_VALIDATION_FAILED: "Configuration validation failed",
+    ErrorCodes.VALIDATION_FAILED: "Validation failed",
+    ErrorCodes.INVALID_SIGNATURE: "Invalid signature",
+    ErrorCodes.INVALID_PROOF: "Invalid proof",
+    ErrorCodes.MERKLE_VERIFICATION_FAILED: "Merkle verification failed",
+    ErrorCodes.SESSION_REQUIRED: "Session required",
+    ErrorCodes.SESSION_UNKNOWN: "Unknown session",
+    ErrorCodes.SESSION_EXPIRED: "Session expired",
+    ErrorCodes.REHANDSHAKE_REQUIRED: "Re-handshake required",
+    ErrorCodes.REPLAY_DETECTED: "Replay detected",
+    ErrorCodes.BAD_AAD: "AAD verification failed",
+    ErrorCodes.BAD_NONCE: "Invalid nonce",
+    ErrorCodes.SEQ_WINDOW_EXCEEDED: "Sequence outside replay window",
+    ErrorCodes.HANDSHAKE_FAILED: "Handshake failed",
+    ErrorCodes.SESSION_LIMIT_EXCEEDED: "Session limit exceeded",
+    ErrorCodes.SEQUENCE_ERROR: "Sequence error",
+    ErrorCodes.DB_ERROR: "Database error",
+    ErrorCodes.DB_CONNECTION_ERROR: "Database connection error",
+}
+
+
 class SystemInfo(StrictModel):
     """System hardware and runtime information for resource assessment"""
 
@@ -537,6 +570,7 @@ __all__ = [
     # constants and codes
     "ProtocolTypes",
     "ErrorCodes",
+    "ERROR_MESSAGES",
     # base
     "StrictModel",
     "CommunicationResult",
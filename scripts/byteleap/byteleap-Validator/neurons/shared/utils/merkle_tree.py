@@ -55,6 +55,9 @@ class MerkleTree:
         self.leaf_hashes = leaf_hashes.copy()
         self.leaf_count = len(leaf_hashes)
         self.root: Optional[MerkleNode] = None
+        # Nodes per level from leaves up to (excluding) the root, odd levels padded
+        # with their last node, so the sibling of node i on a level is i ^ 1
+        self._levels: List[List[MerkleNode]] = []
 
         # Build the tree
         self._build_tree()
@@ -72,18 +75,16 @@ class MerkleTree:
 
         # Build tree level by level
         while len(current_level) > 1:
+            if len(current_level) % 2:
+                # Odd number of nodes - duplicate the last one
+                current_level.append(current_level[-1])
+            self._levels.append(current_level)
             next_level = []
 
             # Process pairs of nodes
             for i in range(0, len(current_level), 2):
                 left_child = current_level[i]
-
-                if i + 1 < len(current_level):
-                    # We have a pair
-                    right_child = current_level[i + 1]
-                else:
-                    # Odd number of nodes - duplicate the last one
-                    right_child = current_level[i]
+                right_child = current_level[i + 1]
 
                 # Create parent node
                 combined_hash = self._hash_pair(
@@ -137,9 +138,13 @@ class MerkleTree:
         proof_hashes = []
         proof_directions = []
 
-        self._collect_proof_path_bottom_up(
-            self.root, leaf_index, proof_hashes, proof_directions
-        )
+        # Bit L of leaf_index tells whether the path is a left or right child
+        # at level L, so no subtree search is needed
+        for level, level_nodes in enumerate(self._levels):
+            index = leaf_index >> level
+            proof_hashes.append(level_nodes[index ^ 1].hash_value)
+            # A left child (bit clear) has its sibling on the right
+            proof_directions.append(not index & 1)
 
         return MerkleProof(
             leaf_index=leaf_index,
@@ -148,60 +153,6 @@ class MerkleTree:
             proof_directions=proof_directions,
         )
 
-    def _contains_leaf_index(
-        self, node: Optional[MerkleNode], target_index: int
-    ) -> bool:
-        """Check if a subtree contains a specific leaf index"""
-        if not node:
-            return False
-
-        if node.is_leaf:
-            return node.leaf_index == target_index
-
-        # Check both children
-        return self._contains_leaf_index(
-            node.left_child, target_index
-        ) or self._contains_leaf_index(node.right_child, target_index)
-
-    def _collect_proof_path_bottom_up(
-        self,
-        node: MerkleNode,
-        target_index: int,
-        proof_hashes: List[str],
-        proof_directions: List[bool],
-    ) -> bool:
-        """
-        Collect proof path from leaf to root (natural verification order)
-
-        Returns True if target was found in this subtree
-        """
-        if node.is_leaf:
-            return node.leaf_index == target_index
-
-        # Check which child contains our target
-        left_contains_target = self._contains_leaf_index(node.left_child, target_index)
-
-        if left_contains_target:
-            # Target is in left subtree
-            found = self._collect_proof_path_bottom_up(
-                node.left_child, target_index, proof_hashes, proof_directions
-            )
-            if found:
-                # Right sibling hash for verification path
-                proof_hashes.append(node.right_child.hash_value)
-                proof_directions.append(True)  # Right sibling
-            return found
-        else:
-            # Target is in right subtree
-            found = self._collect_proof_path_bottom_up(
-                node.right_child, target_index, proof_hashes, proof_directions
-            )
-            if found:
-                # Left sibling hash for verification path
-                proof_hashes.append(node.left_child.hash_value)
-                proof_directions.append(False)  # Left sibling
-            return found
-
     def generate_batch_proofs(self, leaf_indices: List[int]) -> List[MerkleProof]:
         """
         Generate proofs for multiple leaves efficiently
@@ -401,7 +401,7 @@ class ValidatorCommunicationService:
                     return synapse
 
                 # Convert decrypted data to request object
-                request_data = processor.request_class(**decrypted_data)
+                request_data = processor.request_class.model_validate(decrypted_data)
                 decryption_time = 0.0  # Session manager handles timing internally
 
                 bt.logging.debug(